@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from pathlib import Path
-from typing import Any, cast
+from typing import Any
 
 from homeassistant.components import persistent_notification
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.json import save_json
+from homeassistant.util.json import json_loads
 
 from .const import (
     DOMAIN,
@@ -413,17 +414,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                         manager.profile_store.rebuild_envelope(corrected_profile)
                     else:
                         # Rebuild for the detected profile if present on the cycle.
-                        cycles = manager.profile_store.get_past_cycles()
-                        cycle = next(
-                            (
-                                cd
-                                for c in cycles
-                                if isinstance(c, dict)
-                                for cd in (cast(dict[str, Any], c),)
-                                if cd.get("id") == cycle_id
-                            ),
-                            None,
-                        )
+                        cycle = manager.profile_store.get_cycle(cycle_id)
                         profile_name = cycle.get("profile_name") if cycle else None
                         if isinstance(profile_name, str) and profile_name:
                             manager.profile_store.rebuild_envelope(profile_name)
@@ -482,7 +473,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             target = target.resolve()
 
             # Write export
-            target.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            # orjson-encoded (indented) and written off the event loop
+            await hass.async_add_executor_job(save_json, str(target), payload)
             _LOGGER.info("Exported ha_washdata entry %s to %s", entry_id, target)
 
         hass.services.async_register(DOMAIN, "export_config", handle_export_config)
@@ -518,7 +510,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 raise ValueError(f"File not found: {source}")
 
             try:
-                payload = json.loads(source.read_text(encoding="utf-8"))
+                payload = json_loads(await hass.async_add_executor_job(source.read_bytes))
             except Exception as err:  # noqa: BLE001
                 raise ValueError(f"Failed to read import file: {err}") from err
 
@@ -13,42 +13,56 @@ except ImportError:
 
 _LOGGER = logging.getLogger(__name__)
 
+def _standardize(x: np.ndarray) -> np.ndarray:
+    """Zero-mean/unit-std copy of x; near-flat series are returned unchanged."""
+    std = np.std(x)
+    if std > 1e-6:
+        return (x - np.mean(x)) / std
+    return x
+
+
+def prepare_current_trace(
+    current_power: list[float] | np.ndarray,
+) -> tuple[np.ndarray, int, np.ndarray]:
+    """Precompute the current-trace side of find_best_alignment.
+
+    Returns (trace, coarse downsample factor, standardized coarse trace).
+    These depend only on the current trace, so matching against many
+    profiles computes them once instead of once per profile.
+    """
+    curr = np.asarray(current_power, dtype=float)
+
+    # Downsample for speed if arrays are large
+    ds_factor = 1
+    if len(curr) > 200:
+        ds_factor = int(len(curr) / 100)
+
+    c_coarse = curr[::ds_factor] if ds_factor > 1 else curr
+    return curr, ds_factor, _standardize(c_coarse)
+
+
 def find_best_alignment(
     current_power: list[float] | np.ndarray,
     sample_power: list[float] | np.ndarray,
-    dt: float = 1.0  # pylint: disable=unused-argument
+    dt: float = 1.0,  # pylint: disable=unused-argument
+    prepared: tuple[np.ndarray, int, np.ndarray] | None = None,
 ) -> tuple[float, dict[str, float], int]:
-    """Find Best Alignment using Coarse-to-Fine Search (CPU Bound)."""
+    """Find Best Alignment using Coarse-to-Fine Search (CPU Bound).
 
-    curr = np.array(current_power)
+    prepared may carry prepare_current_trace(current_power) when the same
+    trace is aligned against several samples.
+    """
+    if prepared is None:
+        prepared = prepare_current_trace(current_power)
+    curr, ds_factor, c_norm = prepared
     ref = np.array(sample_power)
 
     n_curr = len(curr)
     n_ref = len(ref)
 
     # 1. Coarse Alignment (Cross-Correlation)
-    # Downsample for speed if arrays are large
-    ds_factor = 1
-    if n_curr > 200:
-        ds_factor = int(n_curr / 100)
-
-    if ds_factor > 1:
-        c_coarse = curr[::ds_factor]
-        r_coarse = ref[::ds_factor]
-    else:
-        c_coarse = curr
-        r_coarse = ref
-
-    # Standardize
-    if np.std(c_coarse) > 1e-6:
-        c_norm = (c_coarse - np.mean(c_coarse)) / np.std(c_coarse)
-    else:
-        c_norm = c_coarse
-
-    if np.std(r_coarse) > 1e-6:
-        r_norm = (r_coarse - np.mean(r_coarse)) / np.std(r_coarse)
-    else:
-        r_norm = r_coarse
+    r_coarse = ref[::ds_factor] if ds_factor > 1 else ref
+    r_norm = _standardize(r_coarse)
 
     # Cross correlation
     correlation = np.correlate(c_norm, r_norm, mode="full")
@@ -101,14 +115,20 @@ def find_best_alignment(
 
     mae = np.mean(np.abs(c_final - r_final))
 
-    # Correlation
-    if np.std(c_final) > 1e-6 and np.std(r_final) > 1e-6:
-        corr = np.corrcoef(c_final, r_final)[0, 1]
+    # Correlation from the centred dot products; a (near-)flat series,
+    # std <= 1e-6, carries no shape to correlate and counts as 0
+    c_dev = c_final - np.mean(c_final)
+    r_dev = r_final - np.mean(r_final)
+    c_ss = float(np.dot(c_dev, c_dev))
+    r_ss = float(np.dot(r_dev, r_dev))
+    min_ss = len(c_final) * 1e-12
+    if c_ss > min_ss and r_ss > min_ss:
+        corr = min(1.0, max(-1.0, float(np.dot(c_dev, r_dev)) / np.sqrt(c_ss * r_ss)))
     else:
         corr = 0.0
 
     mae_score = 100.0 / (100.0 + mae)
-    score = (0.6 * max(0, corr)) + (0.4 * mae_score)
+    score = (0.6 * max(0.0, corr)) + (0.4 * mae_score)
 
     return float(score), {"mae": float(mae), "corr": float(corr)}, final_offset
 
@@ -117,60 +137,78 @@ def compute_dtw_lite(
 ) -> float:
     """
     Compute DTW distance with Sakoe-Chiba band constraint.
-    Optimized 1D DP implementation. O(N*W).
+    Cost-only 1D DP implementation. O(N*W) time, O(M) memory.
+
+    Only the final cost is needed (no path), so two rows are ping-ponged and
+    only the band cells are touched per row instead of refilling/copying the
+    whole row.
     """
-    n, m = len(x), len(y)
+    # Python floats: scalar indexing is much cheaper than on numpy arrays
+    return _dtw_cost(
+        np.asarray(x, dtype=float).tolist(),
+        np.asarray(y, dtype=float).tolist(),
+        band_width_ratio,
+    )
+
+
+def _dtw_cost(
+    x_vals: list[float], y_vals: list[float], band_width_ratio: float
+) -> float:
+    """Banded DTW cost on plain float lists (see compute_dtw_lite).
+
+    Batch callers convert a shared trace once and call this directly.
+    """
+    n, m = len(x_vals), len(y_vals)
     if n == 0 or m == 0:
         return float("inf")
 
     # Band width
     w = max(1, int(min(n, m) * band_width_ratio))
 
-    # Use two rows to save memory and improve cache locality
-    prev_row = np.full(m + 1, float("inf"))
-    curr_row = np.full(m + 1, float("inf"))
-    prev_row[0] = 0
+    inf = float("inf")
+    prev_row = [inf] * (m + 1)
+    curr_row = [inf] * (m + 1)
+    prev_row[0] = 0.0
+
+    # Lowest index at which each buffer may still hold finite values.
+    # The band only moves right, so stale cells are always left of it.
+    prev_lo = 0
+    curr_lo = 0
 
     for i in range(1, n + 1):
         center = int(i * (m / n))
         start_j = max(1, center - w)
         end_j = min(m, center + w + 1)
 
-        curr_row.fill(float("inf"))
-        
-        # Pre-calculate costs for the current window to reduce Python overhead
-        # x is 0-indexed, so x[i-1]
-        val_x = x[i - 1]
-        
+        # Clear what this buffer held two rows ago that lies before the band
+        for j in range(curr_lo, start_j):
+            curr_row[j] = inf
+
+        val_x = x_vals[i - 1]
+        left = curr_row[start_j - 1]
+
         for j in range(start_j, end_j + 1):
-            cost = abs(float(val_x - y[j - 1]))
-            
+            cost = abs(val_x - y_vals[j - 1])
+
             # Standard DTW recursion
             # curr_row[j] = cost + min(insertion, deletion, match)
             # insertion: prev_row[j]
-            # deletion: curr_row[j-1]
+            # deletion: curr_row[j-1] (carried in `left`)
             # match: prev_row[j-1]
-            
-            # Use a slightly faster min implementation if possible
             m1 = prev_row[j]
-            m2 = curr_row[j - 1]
             m3 = prev_row[j - 1]
-            
-            if m1 < m2:
-                if m1 < m3:
-                    best_prev = m1
-                else:
-                    best_prev = m3
+
+            if m1 < left:
+                best_prev = m1 if m1 < m3 else m3
             else:
-                if m2 < m3:
-                    best_prev = m2
-                else:
-                    best_prev = m3
-                    
-            curr_row[j] = cost + best_prev
-            
-        # Swap rows
-        prev_row[:] = curr_row[:]
+                best_prev = left if left < m3 else m3
+
+            left = cost + best_prev
+            curr_row[j] = left
+
+        # Swap rows (references only)
+        prev_row, curr_row = curr_row, prev_row
+        prev_lo, curr_lo = start_j, prev_lo
 
     return float(prev_row[m])
 
@@ -187,7 +225,9 @@ def compute_matches_worker(
     max_duration_ratio = config.get("max_duration_ratio", 1.3)
     dtw_bandwidth = config.get("dtw_bandwidth", 0.1)
 
-    curr_arr = np.array(current_power)
+    # Current-trace alignment prep is shared by every snapshot
+    prepared = prepare_current_trace(current_power)
+    curr_arr = prepared[0]
 
     for item in snapshots:
         name = item["name"]
@@ -202,7 +242,7 @@ def compute_matches_worker(
 
         # Core Similarity
         score, metrics, offset = find_best_alignment(
-            current_power, sample_power, 1.0
+            current_power, sample_power, 1.0, prepared=prepared
         )
 
         if score > 0.1:
@@ -221,17 +261,15 @@ def compute_matches_worker(
     # Stage 3: DTW Refinement on Top 3
     if dtw_bandwidth > 0.0 and len(candidates) > 0:
         to_refine = candidates[:3]
+        # Convert the shared current trace once for all refinements
+        curr_vals = np.asarray(curr_arr, dtype=float).tolist()
 
         for cand in to_refine:
-            sample_arr = np.array(cand["sample"])
+            sample_vals = np.asarray(cand["sample"], dtype=float).tolist()
 
-            dtw_dist = compute_dtw_lite(
-                curr_arr,
-                sample_arr,
-                band_width_ratio=dtw_bandwidth,
-            )
+            dtw_dist = _dtw_cost(curr_vals, sample_vals, dtw_bandwidth)
 
-            n_points = len(curr_arr)
+            n_points = len(curr_vals)
             if n_points > 0:
                 norm_dist = dtw_dist / n_points
             else:
@@ -262,17 +300,24 @@ def compute_dtw_path(
     cost_matrix = np.full((n + 1, m + 1), float("inf"))
     cost_matrix[0, 0] = 0
 
-    # Cost Matrix
+    x_arr = np.asarray(x, dtype=float)
+    y_arr = np.asarray(y, dtype=float)
+
+    # Cost Matrix, one band row at a time. With u[j] = min(up, diag) taken
+    # from the previous row, D[j] = c[j] + min(u[j], D[j-1]) unrolls to
+    # D[j] = C[j] + min_{k<=j}(u[k] - C[k-1]) where C is the cumsum of c,
+    # so the left-neighbour dependency becomes a running minimum.
     for i in range(1, n + 1):
         center = i * (m / n)
         start_j = max(1, int(center - w))
         end_j = min(m, int(center + w) + 1)
 
-        for j in range(start_j, end_j + 1):
-            cost = abs(float(x[i - 1] - y[j - 1]))
-            cost_matrix[i, j] = cost + min(
-                cost_matrix[i - 1, j], cost_matrix[i, j - 1], cost_matrix[i - 1, j - 1]
-            )
+        costs = np.abs(x_arr[i - 1] - y_arr[start_j - 1:end_j])
+        prev = cost_matrix[i - 1]
+        u = np.minimum(prev[start_j:end_j + 1], prev[start_j - 1:end_j])
+        csum = np.cumsum(costs)
+        shifted = np.concatenate(([0.0], csum[:-1]))
+        cost_matrix[i, start_j:end_j + 1] = csum + np.minimum.accumulate(u - shifted)
 
     # Backtracking
     path = []
@@ -956,7 +956,11 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     # We'll rely on auto-labeling or user can label later.
                     
                     # Re-run analysis to get segments
-                    cycle = next((c for c in store.get_past_cycles() if c["id"] in self._editor_selected_ids), None)
+                    cycle = (
+                        store.get_cycle(self._editor_selected_ids[0])
+                        if self._editor_selected_ids
+                        else None
+                    )
                     if cycle:
 
                         segments = await self.hass.async_add_executor_job(
@@ -1005,7 +1009,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
         if self._editor_action == "split":
             cid = self._editor_selected_ids[0]
-            cycle = next((c for c in store.get_past_cycles() if c["id"] == cid), None)
+            cycle = store.get_cycle(cid)
             if not cycle:
                 return self.async_abort(reason="cycle_not_found")
             
@@ -1046,7 +1050,8 @@ Click Confirm to split this cycle into {len(segments)} separate cycles.
 
         elif self._editor_action == "merge":
             # Get cycles
-            cycles_to_merge = [c for c in store.get_past_cycles() if c["id"] in self._editor_selected_ids]
+            selected_ids = set(self._editor_selected_ids)
+            cycles_to_merge = [c for c in store.get_past_cycles() if c["id"] in selected_ids]
             cycles_to_merge.sort(key=lambda x: x["start_time"])
             
             # Generate SVG
@@ -2122,14 +2127,7 @@ Joining {len(cycles_to_merge)} cycles. Gaps will be filled with 0W readings.
             )
 
         # Get cycle info for display
-        cycle = next(
-            (
-                c
-                for c in store.get_past_cycles()
-                if c["id"] == self._selected_cycle_id
-            ),
-            None,
-        )
+        cycle = store.get_cycle(self._selected_cycle_id)
         cycle_info = ""
         if cycle:
             dt = dt_util.parse_datetime(cycle["start_time"])
@@ -245,7 +245,7 @@ DEFAULT_PROFILE_MATCH_MIN_DURATION_RATIO_BY_DEVICE = {
 }
 
 # Storage
-STORAGE_VERSION = 3
+STORAGE_VERSION = 4  # v4: past_cycles power_data written as packed blobs
 STORAGE_KEY = "ha_washdata"
 
 # Notification events
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Callable
@@ -170,11 +171,11 @@ class CycleDetector:
         self._last_power: float | None = None
         self._time_in_state: float = 0.0
 
-        # Smoothing buffer
-        self._ma_buffer: list[float] = []
+        # Smoothing buffer (window may change at runtime, so no maxlen)
+        self._ma_buffer: deque[float] = deque()
 
         # Adaptive Sampling Tracker
-        self._recent_dts: list[float] = []  # Track last 20 dt values
+        self._recent_dts: deque[float] = deque(maxlen=20)  # Track last 20 dt values
         self._p95_dt: float = 1.0  # Default assumption
 
         # Profile Matching Tracker
@@ -204,8 +205,6 @@ class CycleDetector:
         if dt <= 0.1:
             return
         self._recent_dts.append(dt)
-        if len(self._recent_dts) > 20:
-            self._recent_dts.pop(0)
 
         # Calculate p95 if enough samples
         if len(self._recent_dts) >= 5:
@@ -302,7 +301,7 @@ class CycleDetector:
         self._current_cycle_start = None
         self._last_active_time = None
         self._cycle_max_power = 0.0
-        self._ma_buffer = []
+        self._ma_buffer.clear()
         self._energy_since_idle_wh = 0.0
         self._time_above_threshold = 0.0
         self._time_below_threshold = 0.0
@@ -376,7 +375,7 @@ class CycleDetector:
         # 1. Smoothing (Legacy buffer for debug/display, logic uses raw + time accumulators)
         self._ma_buffer.append(power)
         if len(self._ma_buffer) > self._config.smoothing_window:
-            self._ma_buffer.pop(0)
+            self._ma_buffer.popleft()
 
         # 2. Accumulators Update
         # Hysteresis Logic
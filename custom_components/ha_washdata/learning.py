@@ -412,8 +412,7 @@ class LearningManager:
         self._auto_label_cycle(cycle_id, profile_name)
 
         # Verify it was labeled (cycle found)
-        cycles = self.profile_store.get_past_cycles()
-        cycle = next((c for c in cycles if c["id"] == cycle_id), None)
+        cycle = self.profile_store.get_cycle(cycle_id)
 
         return bool(cycle and cycle.get("auto_labeled"))
 
@@ -472,8 +471,7 @@ class LearningManager:
         return True
 
     def _auto_label_cycle(self, cycle_id: str, profile_name: str, manual_duration: float | None = None) -> None:
-        cycles = self.profile_store.get_past_cycles()
-        cycle = next((c for c in cycles if c["id"] == cycle_id), None)
+        cycle = self.profile_store.get_cycle(cycle_id)
         if cycle:
             cycle["profile_name"] = profile_name
             cycle["auto_labeled"] = True
@@ -5,8 +5,8 @@
 from __future__ import annotations
 
 import logging
-import hashlib
 import inspect
+import time
 from datetime import datetime, timedelta
 from typing import Any, cast
 import numpy as np
@@ -134,7 +134,7 @@ from .const import (
 )
 from .cycle_detector import CycleDetector, CycleDetectorConfig
 from .learning import LearningManager
-from .profile_store import ProfileStore, decompress_power_data
+from .profile_store import ProfileStore, decompress_power_data, make_cycle_id
 from .recorder import CycleRecorder
 
 _LOGGER = logging.getLogger(__name__)
@@ -448,6 +448,10 @@ class WashDataManager:
         self._manual_program_active: bool = False
         self._notified_pre_completion: bool = False
         self._last_match_result: Any = None  # Stores full MatchResult object
+        # Sensor-facing views of _last_match_result, keyed on its identity
+        self._match_views: dict[str, tuple[Any, Any]] = {}
+        # (cycle start, time.monotonic() at that start) for elapsed-time polls
+        self._cycle_start_monotonic: tuple[datetime, float] | None = None
         self._score_history: dict[str, list[float]] = {}  # Tracks recent scores for trend analysis
         self._match_persistence_counter: dict[str, int] = {}  # Tracks consecutive matches
         self._unmatch_persistence_counter: int = 0  # Tracks consecutive low-confidence matches
@@ -764,7 +768,10 @@ class WashDataManager:
         """Return a lightweight list of top candidates from the last match."""
         if not self._last_match_result:
             return []
-            
+        cached = self._match_views.get("top_candidates")
+        if cached and cached[0] is self._last_match_result:
+            return cast(list[dict[str, Any]], cached[1])
+
         # Get raw list from ranking (best) or candidates
         raw_list = []
         if hasattr(self._last_match_result, "ranking") and self._last_match_result.ranking:
@@ -781,6 +788,7 @@ class WashDataManager:
                 "profile_duration": cand.get("profile_duration"),
                 # Explicitly exclude "current" and "sample" keys which are big lists
             })
+        self._match_views["top_candidates"] = (self._last_match_result, sanitized)
         return sanitized
 
     @property
@@ -1873,9 +1881,10 @@ class WashDataManager:
 
         # Auto-Tune: Check for ghost cycles (short duration AND low energy)
         # Ghost = duration < 60s AND total energy < 0.05 Wh (avoids killing pump-out spikes)
+        # Energy only matters for short cycles; skip integrating long traces
         power_data = cycle_data.get("power_data", [])
         cycle_energy_wh = 0.0
-        if power_data and len(power_data) >= 2:
+        if duration < 60 and power_data and len(power_data) >= 2:
             try:
                 ts = np.array([float(p[0]) if isinstance(p[0], (int, float)) else 0 for p in power_data])
                 ps = np.array([float(p[1]) for p in power_data])
@@ -1947,8 +1956,9 @@ class WashDataManager:
         # Ensure cycle has a stable ID even if store add failed (or did not mutate).
         if not cycle_data.get("id"):
             try:
-                unique_str = f"{cycle_data['start_time']}_{cycle_data['duration']}"
-                cycle_data["id"] = hashlib.sha256(unique_str.encode()).hexdigest()[:12]
+                cycle_data["id"] = make_cycle_id(
+                    cycle_data["start_time"], cycle_data["duration"]
+                )
             except Exception:  # noqa: BLE001
                 pass
 
@@ -2482,6 +2492,11 @@ class WashDataManager:
         in_bounds = False
         best_time_window_start: float | None = None
 
+        # Window-invariant terms of the current trace (Pearson/MAE below)
+        current_centered = current_window_values - current_window_values.mean()
+        current_ss = float(current_centered @ current_centered)
+        current_max = float(np.max(current_window_values))
+
         # Search through envelope TIME grid for best matching position
         for i in range(len(time_grid) - 1):
             time_window_start = time_grid[i]
@@ -2525,14 +2540,16 @@ class WashDataManager:
 
             # Calculate shape similarity to average
             try:
-                if np.std(current_window_values) > 0 and np.std(avg_window) > 0:
-                    correlation = np.corrcoef(current_window_values, avg_window)[0, 1]
+                avg_centered = avg_window - avg_window.mean()
+                denom = np.sqrt(current_ss * float(avg_centered @ avg_centered))
+                if denom > 0:
+                    correlation = float(current_centered @ avg_centered) / denom
                 else:
                     correlation = 0.0
 
                 # MAE against average
                 mae = np.mean(np.abs(current_window_values - avg_window))
-                max_power = max(np.max(avg_window), np.max(current_window_values), 1.0)
+                max_power = max(np.max(avg_window), current_max, 1.0)
                 mae_normalized = 1.0 - min(mae / max_power, 1.0)
 
                 # Combined score: shape + amplitude + bounds compliance
@@ -2677,16 +2694,37 @@ class WashDataManager:
         """Return the start time of the current cycle."""
         return self.detector.current_cycle_start
 
+    @property
+    def cycle_elapsed_seconds(self) -> int:
+        """Return whole seconds since the current cycle started (0 if none)."""
+        start = self.detector.current_cycle_start
+        if start is None:
+            return 0
+        anchor = self._cycle_start_monotonic
+        if anchor is None or anchor[0] != start:
+            # Anchor once per cycle; restored cycles may have started earlier
+            offset = (dt_util.now() - start).total_seconds()
+            anchor = (start, time.monotonic() - offset)
+            self._cycle_start_monotonic = anchor
+        return int(time.monotonic() - anchor[1])
+
     @property
     def last_match_details(self) -> dict[str, Any] | None:
         """Return details of the last profile match."""
         res = getattr(self, "_last_match_result", None)
-        return res.to_dict() if res else None
+        if not res:
+            return None
+        # to_dict() walks the whole result; state writes reuse it per match
+        cached = self._match_views.get("details")
+        if not cached or cached[0] is not res:
+            cached = (res, res.to_dict())
+            self._match_views["details"] = cached
+        return cast(dict[str, Any], cached[1])
 
     @property
     def samples_recorded(self):
         """Return the number of power samples recorded in current cycle."""
-        return len(self.detector.get_power_trace())
+        return self.detector.samples_recorded
 
     @property
     def sample_interval_stats(self):
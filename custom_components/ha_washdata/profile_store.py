@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
 import dataclasses
+import functools
 import hashlib
 import logging
 import os
 import re
+import zlib
 from datetime import datetime, timedelta
 from typing import Any, TypeAlias, cast
-import json
 
 import numpy as np
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 
@@ -29,11 +33,42 @@ from .features import compute_signature
 from .signal_processing import resample_uniform, resample_adaptive, Segment
 from . import analysis
 
+# Optional C ISO-8601 parser; the stdlib parser is used when it is missing
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    _parse_iso = datetime.fromisoformat
+
 _LOGGER = logging.getLogger(__name__)
 
 JSONDict: TypeAlias = dict[str, Any]
 CycleDict: TypeAlias = dict[str, Any]
 
+# Active-cycle snapshots live in their own small store so the periodic
+# saves during a running cycle never rewrite the history file
+STORAGE_KEY_ACTIVE_CYCLE = f"{STORAGE_KEY}.active_cycle"
+ACTIVE_CYCLE_KEYS = ("active_cycle", "last_active_save")
+
+
+@functools.lru_cache(maxsize=512)
+def parse_iso_ts(value: str) -> float:
+    """Return epoch seconds of an ISO timestamp string.
+
+    Memoised: cycle start/end times are re-parsed by every pass over the
+    history (compression, splits, merges, previews). Uses ciso8601 when
+    installed; raises ValueError on malformed input either way.
+    """
+    return _parse_iso(value).timestamp()
+
+
+def make_cycle_id(start_time: Any, duration: Any) -> str:
+    """Return the 12-hex-char id of a cycle from its start time and duration.
+
+    The id is only a dedup key, so a 6-byte BLAKE2b digest is used rather than
+    a truncated SHA-256.
+    """
+    return hashlib.blake2b(f"{start_time}_{duration}".encode(), digest_size=6).hexdigest()
+
 
 def profile_sort_key(name: str) -> tuple[int, int, str]:
     """Sort key for profile names: numeric-prefixed first (by number), then alphabetically."""
@@ -243,7 +278,7 @@ def decompress_power_data(cycle: CycleDict) -> list[tuple[str, float]]:
         return []
 
     try:
-        start_time = datetime.fromisoformat(cycle["start_time"])
+        start_time = _parse_iso(cycle["start_time"])
     except ValueError:
         return []
 
@@ -263,6 +298,69 @@ def decompress_power_data(cycle: CycleDict) -> list[tuple[str, float]]:
     return result
 
 
+def downsample_indices(offsets: np.ndarray, powers: np.ndarray) -> np.ndarray:
+    """Return indices of samples kept when downsampling a power trace.
+
+    A sample is kept if it is an endpoint, differs from the last kept power by
+    more than 1 W, or lies more than 60 s after the last kept sample.
+
+    This is deliberately a scalar loop over .tolist() floats, not a NumPy
+    kernel: the rule depends on the previous *kept* sample, so a np.diff mask
+    (neighbour-to-neighbour) would drop slow drifts and keep-alives, and an
+    exact per-kept-sample vectorized search is slower on busy traces where
+    most samples are kept.
+    """
+    n = len(offsets)
+    if n <= 2:
+        return np.arange(n)
+    t_list = offsets.tolist()
+    p_list = powers.tolist()
+    kept = [0]
+    last_t = t_list[0]
+    last_p = p_list[0]
+    for i in range(1, n - 1):
+        p_val = p_list[i]
+        t_val = t_list[i]
+        if abs(p_val - last_p) > 1.0 or (t_val - last_t) > 60:
+            kept.append(i)
+            last_p = p_val
+            last_t = t_val
+    kept.append(n - 1)
+    return np.asarray(kept, dtype=np.intp)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Return indices of a Largest-Triangle-Three-Buckets downsample.
+
+    Keeps the endpoints plus, per bucket, the sample forming the largest
+    triangle with the previously kept sample and the next bucket's mean, so
+    short spikes survive where plain striding would skip them.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    kept = np.empty(n_out, dtype=np.intp)
+    kept[0] = 0
+    kept[-1] = n - 1
+    a = 0
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+        if b + 2 < len(edges):
+            nxt_lo, nxt_hi = hi, edges[b + 2]
+            c_x = x[nxt_lo:nxt_hi].mean()
+            c_y = y[nxt_lo:nxt_hi].mean()
+        else:
+            c_x, c_y = x[n - 1], y[n - 1]
+        bx = x[lo:hi]
+        by = y[lo:hi]
+        area = np.abs((x[a] - c_x) * (by - y[a]) - (x[a] - bx) * (c_y - y[a]))
+        a = lo + int(np.argmax(area))
+        kept[b + 1] = a
+    return kept
+
+
 def compress_power_data(cycle: CycleDict) -> list[Any] | None:
     """Compress cycle power data to [offset, power] format (Module-level helper).
     
@@ -286,49 +384,256 @@ def compress_power_data(cycle: CycleDict) -> list[Any] | None:
         return None
 
     try:
-        start_ts = datetime.fromisoformat(cycle["start_time"]).timestamp()
-        compressed: list[list[float]] = []
-        
-        last_saved_p = -999.0
-        last_saved_t = -999.0
-        
-        for i, entry in enumerate(raw_data):
-            if isinstance(entry, (list, tuple)) and len(entry) == 2:
-                t_str, p_val_raw = entry
-                try:
-                    # Handle both ISO string and potential timestamp float
-                    if isinstance(t_str, str):
-                        t = datetime.fromisoformat(t_str).timestamp()
-                    else:
-                        t = float(t_str)
-                    
-                    p_val = float(p_val_raw)
-                    offset = round(t - start_ts, 1)
-                    if offset < 0:
-                        offset = 0.0
-                        
-                    # Save first and last
-                    is_endpoint = i == 0 or i == len(raw_data) - 1
-
-                    # Downsample: change > 1W or gap > 60s
-                    if (
-                        is_endpoint
-                        or abs(p_val - last_saved_p) > 1.0
-                        or (offset - last_saved_t) > 60
-                    ):
-                        compressed.append([offset, round(p_val, 1)])
-                        last_saved_p = p_val
-                        last_saved_t = offset
-                        
-                except (ValueError, TypeError):
-                    continue
-        return compressed
+        start_ts = parse_iso_ts(cycle["start_time"])
+        t_vals, p_vals = raw_points_to_arrays(raw_data)
+        offsets = np.maximum(np.round(t_vals - start_ts, 1), 0.0)
+        keep = downsample_indices(offsets, p_vals)
+        return cast(
+            list[Any],
+            np.column_stack((offsets[keep], np.round(p_vals[keep], 1))).tolist(),
+        )
     except Exception:
         return None
 
 
+def relative_power_arrays(cycle: CycleDict) -> tuple[np.ndarray, np.ndarray]:
+    """Return (offsets, powers) arrays of a cycle's compressed power data.
+
+    Same points as decompress_power_data, but kept as relative seconds sorted by
+    offset instead of round-tripping through ISO strings.
+    """
+    empty = (np.empty(0), np.empty(0))
+    compressed_raw = cycle.get("power_data", [])
+    if not isinstance(compressed_raw, list) or not compressed_raw:
+        return empty
+    try:
+        parse_iso_ts(cycle["start_time"])
+    except (KeyError, TypeError, ValueError):
+        return empty
+
+    offsets: list[float] = []
+    powers: list[float] = []
+    for item in compressed_raw:
+        if not isinstance(item, (list, tuple)) or len(item) != 2:
+            continue
+        offset_seconds, power = item
+        if isinstance(offset_seconds, (int, float)) and isinstance(power, (int, float)):
+            offsets.append(float(offset_seconds))
+            powers.append(float(power))
+
+    ts_arr = np.asarray(offsets, dtype=float)
+    p_arr = np.asarray(powers, dtype=float)
+    order = np.argsort(ts_arr, kind="stable")
+    return ts_arr[order], p_arr[order]
+
+
+def slice_segment_points(
+    ts_arr: np.ndarray,
+    p_arr: np.ndarray,
+    seg_start: float,
+    seg_end: float,
+    base_ts: float,
+) -> list[list[float]]:
+    """Extract absolute [timestamp, power] points for a split segment.
+
+    The first point carries the last power reading at or before seg_start (0 W
+    if none), followed by every reading in (seg_start, seg_end]. Bounds come
+    from binary search on the sorted offsets.
+    """
+    lo = int(np.searchsorted(ts_arr, seg_start, side="right"))
+    hi = int(np.searchsorted(ts_arr, seg_end, side="right"))
+    state_val = float(p_arr[lo - 1]) if lo > 0 else 0.0
+
+    points = [[round(base_ts + seg_start, 1), state_val]]
+    points.extend(
+        [round(base_ts + t, 1), p]
+        for t, p in zip(ts_arr[lo:hi].tolist(), p_arr[lo:hi].tolist())
+    )
+    return points
+
+
+_ISO_OFFSET_SUFFIX = re.compile(r"[+-]\d\d:\d\d$")
+
+
+def _raw_points_to_arrays_slow(raw_data: list[Any]) -> tuple[np.ndarray, np.ndarray]:
+    """Per-point fallback of raw_points_to_arrays; skips malformed entries."""
+    timestamps: list[float] = []
+    powers: list[float] = []
+    for point in raw_data:
+        if not isinstance(point, (list, tuple)):
+            continue
+        point_any = cast(list[Any] | tuple[Any, ...], point)
+        try:
+            ts_raw = point_any[0]
+            p_raw = point_any[1]
+        except IndexError:
+            continue
+
+        if isinstance(ts_raw, str):
+            try:
+                t_val = _parse_iso(ts_raw).timestamp()
+            except ValueError:
+                continue
+        elif isinstance(ts_raw, (int, float)):
+            t_val = float(ts_raw)
+        else:
+            continue
+
+        try:
+            p_val = float(p_raw)
+        except (TypeError, ValueError):
+            continue
+
+        timestamps.append(t_val)
+        powers.append(p_val)
+    return np.asarray(timestamps, dtype=float), np.asarray(powers, dtype=float)
+
+
+def raw_points_to_arrays(raw_data: Any) -> tuple[np.ndarray, np.ndarray]:
+    """Convert raw [timestamp, power] points to (epoch seconds, power) arrays.
+
+    Uniform traces are converted in one pass: numeric timestamps directly, ISO
+    strings through numpy's datetime64 parser anchored on datetime.fromisoformat
+    of the first point (so naive/aware semantics match the per-point parse).
+    Mixed or malformed traces fall back to parsing point by point.
+    """
+    if not isinstance(raw_data, list) or not raw_data:
+        return np.empty(0), np.empty(0)
+    try:
+        ts_col = [p[0] for p in raw_data]
+        powers = np.asarray([p[1] for p in raw_data], dtype=float)
+    except (TypeError, ValueError, IndexError, KeyError):
+        return _raw_points_to_arrays_slow(raw_data)
+    if powers.ndim != 1 or not all(isinstance(p, (list, tuple)) for p in raw_data):
+        return _raw_points_to_arrays_slow(raw_data)
+
+    if all(isinstance(t, (int, float)) for t in ts_col):
+        return np.asarray(ts_col, dtype=float), powers
+    if not all(isinstance(t, str) for t in ts_col):
+        return _raw_points_to_arrays_slow(raw_data)
+
+    try:
+        first = ts_col[0]
+        first_dt = _parse_iso(first)
+        if first_dt.tzinfo is not None:
+            # numpy only parses naive strings; strip a shared "+HH:MM" suffix
+            suffix = first[-6:]
+            if not _ISO_OFFSET_SUFFIX.match(suffix) or not all(
+                t.endswith(suffix) for t in ts_col
+            ):
+                return _raw_points_to_arrays_slow(raw_data)
+            ts_col = [t[:-6] for t in ts_col]
+        secs = np.asarray(ts_col, dtype="datetime64[us]").astype(np.int64) / 1e6
+    except ValueError:
+        return _raw_points_to_arrays_slow(raw_data)
+    return secs + (first_dt.timestamp() - secs[0]), powers
+
+
+# Quantized blob: zlib(code byte + int32 offset deltas + powers), all in 0.1 units
+_PACKED_QUANT_PREFIX = "q1:"
+_PACKED_POWER_DTYPES: dict[int, str] = {1: "<u2", 2: "<i4"}
+
+
+def pack_power_data(points: list[Any]) -> str | None:
+    """Pack compressed [offset, power] pairs into a quantized base64 zlib blob.
+
+    Values are stored in tenths (the 0.1 grid add_cycle rounds to): offsets as
+    int32 deltas, powers as uint16 when they fit in 0..6553.5 W, else int32.
+    Finer precision is lost; this is the storage v4 format.
+    Returns None if the points are not a uniform numeric pair list (e.g. legacy
+    ISO-string traces), in which case they should be persisted as-is.
+    """
+    try:
+        arr = np.asarray(points, dtype=float)
+    except (TypeError, ValueError):
+        return None
+    if arr.ndim != 2 or arr.shape[1] != 2 or not np.isfinite(arr).all():
+        return None
+
+    quant = np.rint(arr * 10.0)
+    deltas = np.diff(quant[:, 0], prepend=0.0)
+    powers = quant[:, 1]
+    int32 = np.iinfo(np.int32)
+    if len(quant) and (
+        np.abs(deltas).max() > int32.max or np.abs(powers).max() > int32.max
+    ):
+        return None
+    code = 1 if not len(powers) or (powers.min() >= 0 and powers.max() <= 65535) else 2
+    raw = (
+        bytes([code])
+        + deltas.astype("<i4").tobytes()
+        + powers.astype(_PACKED_POWER_DTYPES[code]).tobytes()
+    )
+    return _PACKED_QUANT_PREFIX + base64.b64encode(zlib.compress(raw)).decode("ascii")
+
+
+def unpack_power_data(blob: str) -> list[list[float]]:
+    """Inverse of pack_power_data."""
+    if not blob.startswith(_PACKED_QUANT_PREFIX):
+        raise ValueError("unknown packed power data format")
+
+    raw = zlib.decompress(base64.b64decode(blob[len(_PACKED_QUANT_PREFIX):]))
+    if not raw or raw[0] not in _PACKED_POWER_DTYPES:
+        raise ValueError("unknown packed power data encoding")
+    p_dtype = np.dtype(_PACKED_POWER_DTYPES[raw[0]])
+    n_points, rem = divmod(len(raw) - 1, 4 + p_dtype.itemsize)
+    if rem:
+        raise ValueError("truncated packed power data")
+    offsets = np.cumsum(np.frombuffer(raw, dtype="<i4", count=n_points, offset=1), dtype=np.int64)
+    powers = np.frombuffer(raw, dtype=p_dtype, count=n_points, offset=1 + 4 * n_points)
+    return cast(
+        list[list[float]],
+        np.column_stack((offsets / 10.0, powers.astype(np.float64) / 10.0)).tolist(),
+    )
+
+
+def _unpack_store_cycles(data: JSONDict) -> None:
+    """Expand packed power_data blobs of a loaded store payload in place."""
+    cycles = data.get("past_cycles")
+    if not isinstance(cycles, list):
+        return
+    for cycle in cycles:
+        blob = cycle.get("power_data") if isinstance(cycle, dict) else None
+        if isinstance(blob, str):
+            try:
+                cycle["power_data"] = unpack_power_data(blob)
+            except (ValueError, zlib.error) as e:
+                _LOGGER.warning(
+                    "Dropping unreadable power data for cycle %s: %s", cycle.get("id"), e
+                )
+                cycle.pop("power_data", None)
+
+
+def pack_store_cycles(data: JSONDict) -> JSONDict:
+    """Return a shallow copy of a store payload with cycle power_data packed.
+
+    Used as the data passed to Store saves; the live payload is not modified.
+    """
+    cycles = data.get("past_cycles")
+    if not isinstance(cycles, list):
+        return data
+    packed_cycles: list[Any] = []
+    for cycle in cycles:
+        points = cycle.get("power_data") if isinstance(cycle, dict) else None
+        blob = pack_power_data(points) if isinstance(points, list) and points else None
+        packed_cycles.append(cycle if blob is None else {**cycle, "power_data": blob})
+    return {**data, "past_cycles": packed_cycles}
+
+
 class WashDataStore(Store[JSONDict]):
-    """Store implementation with migration support."""
+    """Store implementation with migration support.
+
+    From storage v4 cycle power traces are persisted as packed blobs (see
+    pack_store_cycles) and expanded back to [offset, power] lists on load, so
+    the rest of the integration only ever sees lists.
+    """
+
+    async def async_load(self) -> JSONDict | None:
+        """Load data, expanding packed power traces."""
+        data = await super().async_load()
+        if data:
+            _unpack_store_cycles(data)
+        return data
 
     async def _async_migrate_func(
         self,
@@ -337,6 +642,13 @@ class WashDataStore(Store[JSONDict]):
         old_data: JSONDict,
     ) -> JSONDict:
         """Migrate data to the new version."""
+        if old_major_version > STORAGE_VERSION:
+            # Written by a newer release; its format may not be readable here
+            raise NotImplementedError
+
+        # Migrations always operate on expanded [offset, power] lists
+        _unpack_store_cycles(old_data)
+
         if old_major_version < 2:
             _LOGGER.info("Migrating storage from v%s to v2", old_major_version)
             # Logic moved from ProfileStore._migrate_v1_to_v2
@@ -345,21 +657,10 @@ class WashDataStore(Store[JSONDict]):
             for cycle in cycles:
                 if "signature" not in cycle and cycle.get("power_data"):
                     try:
-                        # Decompress using helper
-                        tuples = decompress_power_data(cycle)
-                        if tuples and len(tuples) > 10:
-                            # Convert to relative time arrays for signature computation
-                            start = datetime.fromisoformat(
-                                cycle["start_time"]
-                            ).timestamp()
-                            ts_arr = []
-                            p_arr = []
-                            for t_str, p in tuples:
-                                t = datetime.fromisoformat(t_str).timestamp()
-                                ts_arr.append(t - start)
-                                p_arr.append(p)
-
-                            sig = compute_signature(np.array(ts_arr), np.array(p_arr))
+                        # Relative time arrays straight from the stored offsets
+                        ts_arr, p_arr = relative_power_arrays(cycle)
+                        if len(ts_arr) > 10:
+                            sig = compute_signature(ts_arr, p_arr)
                             cycle["signature"] = dataclasses.asdict(sig)
                             migrated_cycles += 1
                     except Exception as e:  # pylint: disable=broad-exception-caught
@@ -415,6 +716,27 @@ class WashDataStore(Store[JSONDict]):
                 "Migration v2->v3: Compressed data for %s cycles", migrated_count
             )
 
+        if old_major_version < 4:
+            # v4 writes power_data as packed blobs (see pack_store_cycles),
+            # which older releases cannot read. The packed format is lossy:
+            # offsets and powers are quantized to 0.1 s / 0.1 W (the grid
+            # add_cycle already rounds to). Snap the expanded lists to that
+            # grid now so memory matches what the next load will return.
+            _LOGGER.info("Migrating storage from v%s to v4", old_major_version)
+            quantized = 0
+            for cycle in old_data.get("past_cycles", []):
+                points = cycle.get("power_data") if isinstance(cycle, dict) else None
+                blob = pack_power_data(points) if isinstance(points, list) and points else None
+                if blob is not None:
+                    snapped = unpack_power_data(blob)
+                    if snapped != points:
+                        cycle["power_data"] = snapped
+                        quantized += 1
+            _LOGGER.info(
+                "Migration v3->v4: Quantized power data to 0.1 s / 0.1 W for %s cycles",
+                quantized,
+            )
+
         return old_data
 
     async def get_storage_stats(self) -> dict[str, Any]:
@@ -488,6 +810,11 @@ class ProfileStore:
 
         # Cache for resampled sample segments: key=(cycle_id, dt)
         self._cached_sample_segments: dict[tuple[str, float], Segment] = {}
+        # Cache for decompressed sample power arrays: key=cycle_id
+        self._cached_sample_power: dict[str, np.ndarray] = {}
+        # id -> cycle index over past_cycles, rebuilt when the list changes shape
+        self._cycle_index: dict[str, CycleDict] = {}
+        self._cycle_index_key: tuple[int, int, int] | None = None
         # Profile duration tolerance (set by manager; reserved for duration-based heuristics)
         self._duration_tolerance: float = 0.25
         # Retention policy: cap total cycles and number of full-resolution traces per profile
@@ -495,9 +822,15 @@ class ProfileStore:
         self._max_full_traces_per_profile = DEFAULT_MAX_FULL_TRACES_PER_PROFILE
         self._max_full_traces_unlabeled = DEFAULT_MAX_FULL_TRACES_UNLABELED
         # Separate store for each entry to avoid giant files
-        # Use WashDataStore to handle migration
+        # Use WashDataStore to handle migration; atomic writes so an interrupted
+        # save never truncates the (large) history file
         self._store: Store[JSONDict] = WashDataStore(
-            hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry_id}"
+            hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry_id}", atomic_writes=True
+        )
+        # Packing runs in the executor; keep saves in call order
+        self._save_lock = asyncio.Lock()
+        self._active_store: Store[JSONDict] = Store(
+            hass, 1, f"{STORAGE_KEY_ACTIVE_CYCLE}.{entry_id}", atomic_writes=True
         )
         self._data: JSONDict = {
             "profiles": {},
@@ -598,6 +931,38 @@ class ProfileStore:
         except (TypeError, ValueError):
             return
 
+    def get_cycle(self, cycle_id: str) -> CycleDict | None:
+        """Return the stored cycle with this id, or None.
+
+        Lookups go through an id index that is rebuilt whenever the past_cycles
+        list is replaced, grows/shrinks or gets a new tail; a miss or an id that
+        changed in place (merge) forces one rebuild before giving up.
+        """
+        cycles = self.get_past_cycles()
+        key = (id(cycles), len(cycles), id(cycles[-1]) if cycles else 0)
+        rebuilt = False
+        if key != self._cycle_index_key:
+            self._rebuild_cycle_index(cycles, key)
+            rebuilt = True
+        cycle = self._cycle_index.get(cycle_id)
+        if (cycle is None or cycle.get("id") != cycle_id) and not rebuilt:
+            self._rebuild_cycle_index(cycles, key)
+            cycle = self._cycle_index.get(cycle_id)
+        if cycle is None or cycle.get("id") != cycle_id:
+            return None
+        return cycle
+
+    def _rebuild_cycle_index(
+        self, cycles: list[CycleDict], key: tuple[int, int, int]
+    ) -> None:
+        """Rebuild the id index; the first cycle wins on duplicate ids."""
+        index: dict[str, CycleDict] = {}
+        for c in cycles:
+            if c.get("id"):
+                index.setdefault(c["id"], c)
+        self._cycle_index = index
+        self._cycle_index_key = key
+
     def get_duration_ratio_limits(self) -> tuple[float, float]:
         """Return (min_duration_ratio, max_duration_ratio) used for duration matching."""
         return (float(self._min_duration_ratio), float(self._max_duration_ratio))
@@ -616,6 +981,29 @@ class ProfileStore:
         data = await self._store.async_load()
         if data:
             self._data = data
+            self._invalidate_sample_caches()
+            self._warm_sample_caches()
+
+        # Once written, the snapshot store is authoritative; older releases
+        # kept these keys in the history file itself
+        active = await self._active_store.async_load()
+        if active is not None:
+            for key in ACTIVE_CYCLE_KEYS:
+                self._data.pop(key, None)
+                if active.get(key) is not None:
+                    self._data[key] = active[key]
+
+    def _warm_sample_caches(self) -> None:
+        """Pre-build float32 power arrays for every profile's sample cycle.
+
+        Done once after load so the first live match does not pay for
+        converting the stored [offset, power] lists.
+        """
+        for profile in self._data.get("profiles", {}).values():
+            sample_id = profile.get("sample_cycle_id")
+            sample_cycle = self.get_cycle(sample_id) if sample_id else None
+            if sample_cycle:
+                self._get_cached_sample_power(sample_cycle)
 
     # _migrate_v1_to_v2 and _decompress_power_from_raw removed; logic moved to WashDataStore
 
@@ -706,14 +1094,30 @@ class ProfileStore:
         return stats
 
     async def async_save(self) -> None:
-        """Save data to storage."""
-        await self._store.async_save(self._data)
+        """Save data to storage, packing power traces in the executor."""
+        async with self._save_lock:
+            # Shallow-copy on the loop so later list edits don't race the pack
+            snapshot = {
+                key: value
+                for key, value in self._data.items()
+                if key not in ACTIVE_CYCLE_KEYS
+            }
+            if isinstance(snapshot.get("past_cycles"), list):
+                snapshot["past_cycles"] = list(snapshot["past_cycles"])
+            packed = await self.hass.async_add_executor_job(pack_store_cycles, snapshot)
+            await self._store.async_save(packed)
 
     async def async_save_active_cycle(self, detector_snapshot: JSONDict) -> None:
         """Save the active cycle state to storage (throttled by Manager)."""
         self._data["active_cycle"] = detector_snapshot
-        self._data["last_active_save"] = dt_util.now().isoformat()
-        await self._store.async_save(self._data)
+        self._data["last_active_save"] = dt_util.utcnow().isoformat()
+        await self._async_save_active_cycle_store()
+
+    async def _async_save_active_cycle_store(self) -> None:
+        """Persist only the active-cycle keys to their own small store."""
+        await self._active_store.async_save(
+            {key: self._data.get(key) for key in ACTIVE_CYCLE_KEYS}
+        )
 
     def get_active_cycle(self) -> JSONDict | None:
         """Get the saved active cycle."""
@@ -736,7 +1140,7 @@ class ProfileStore:
         """Clear the active cycle snapshot from storage."""
         if "active_cycle" in self._data:
             del self._data["active_cycle"]
-            await self._store.async_save(self._data)
+            await self._async_save_active_cycle_store()
 
     def add_cycle(self, cycle_data: CycleDict) -> None:
         """Add a completed cycle to history (sync wrapper, schedules async tasks)."""
@@ -750,9 +1154,7 @@ class ProfileStore:
 
     def _add_cycle_data(self, cycle_data: CycleDict) -> None:
         """Internal logic to add cycle data to storage."""
-        # Generate SHA256 ID
-        unique_str = f"{cycle_data['start_time']}_{cycle_data['duration']}"
-        cycle_data["id"] = hashlib.sha256(unique_str.encode()).hexdigest()[:12]
+        cycle_data["id"] = make_cycle_id(cycle_data["start_time"], cycle_data["duration"])
 
         # Preserve profile_name if already set by manager; default to None otherwise
         if "profile_name" not in cycle_data:
@@ -765,39 +1167,14 @@ class ProfileStore:
         _LOGGER.debug("add_cycle: raw_data has %s points", len(raw_data))
 
         if raw_data:
-            start_ts = datetime.fromisoformat(cycle_data["start_time"]).timestamp()
-            stored: list[list[float]] = []
-            offsets: list[float] = []
-
-            for point in raw_data:
-                if not isinstance(point, (list, tuple)):
-                    continue
-                point_any = cast(list[Any] | tuple[Any, ...], point)
-                try:
-                    ts_raw = point_any[0]
-                    p_raw = point_any[1]
-                except IndexError:
-                    continue
-
-                if isinstance(ts_raw, str):
-                    try:
-                        t_val = datetime.fromisoformat(ts_raw).timestamp()
-                    except ValueError:
-                        continue
-                elif isinstance(ts_raw, (int, float)):
-                    t_val = float(ts_raw)
-                else:
-                    continue
+            start_ts = parse_iso_ts(cycle_data["start_time"])
+            t_vals, p_vals = raw_points_to_arrays(raw_data)
 
-                try:
-                    p_val = float(p_raw)
-                except (TypeError, ValueError):
-                    continue
-
-                # Store as [offset_seconds, power] for consistency
-                offset = round(t_val - start_ts, 1)
-                offsets.append(offset)
-                stored.append([offset, round(p_val, 1)])
+            # Store as [offset_seconds, power] for consistency
+            offsets = np.round(t_vals - start_ts, 1)
+            stored: list[list[float]] = np.column_stack(
+                (offsets, np.round(p_vals, 1))
+            ).tolist()
 
             # Calculate average sampling interval (in seconds)
             if len(offsets) > 1:
@@ -822,6 +1199,9 @@ class ProfileStore:
             
             cycle_data["power_data"] = stored
             cycle_data["sampling_interval"] = round(sampling_interval, 1)
+            # Peak is needed by merges/UI; derive it once here if the caller didn't
+            if "max_power" not in cycle_data and len(p_vals):
+                cycle_data["max_power"] = round(float(np.max(p_vals)), 1)
 
             # Helper to get arrays for signature (use stored data for consistency)
             ts_arr = np.array([t for t, _ in stored])
@@ -881,39 +1261,38 @@ class ProfileStore:
                 pass
             drop_count = len(cycles) - self._max_past_cycles
             to_drop = cycles[:drop_count]
+            kept = cycles[drop_count:]
 
             # Maintain profile sample references when dropping
-            sample_refs = {
-                name: p.get("sample_cycle_id")
-                for name, p in self._data.get("profiles", {}).items()
-            }
+            profiles_by_sample: dict[Any, list[str]] = {}
+            for name, p in self._data.get("profiles", {}).items():
+                profiles_by_sample.setdefault(p.get("sample_cycle_id"), []).append(name)
             for cy in to_drop:
                 # Track affected profile
                 p_name = cy.get("profile_name")
                 if p_name:
                     affected_profiles.add(p_name)
 
-                cy_id = cy.get("id")
                 # If a profile sample points here, try to move to most recent cycle of that profile
-                for name, ref_id in list(sample_refs.items()):
-                    if ref_id == cy_id:
-                        # find newest cycle for that profile
-                        newest = next(
-                            (
-                                c
-                                for c in reversed(cycles)
-                                if c.get("profile_name") == name and c not in to_drop
-                            ),
-                            None,
+                for name in profiles_by_sample.get(cy.get("id"), []):
+                    # find newest cycle for that profile
+                    newest = next(
+                        (
+                            c
+                            for c in reversed(kept)
+                            if c.get("profile_name") == name
+                        ),
+                        None,
+                    )
+                    if newest:
+                        self._data["profiles"][name]["sample_cycle_id"] = (
+                            newest.get("id")
                         )
-                        if newest:
-                            self._data["profiles"][name]["sample_cycle_id"] = (
-                                newest.get("id")
-                            )
-                        else:
-                            # No replacement available
-                            self._data["profiles"][name].pop("sample_cycle_id", None)
+                    else:
+                        # No replacement available
+                        self._data["profiles"][name].pop("sample_cycle_id", None)
             # Actually drop
+            self._evict_sample_caches(cy.get("id") for cy in to_drop)
             del cycles[:drop_count]
 
         # 2) Strip older full traces per profile
@@ -961,6 +1340,7 @@ class ProfileStore:
                     if c.get("power_data"):
                         c.pop("power_data", None)
                         c.pop("sampling_interval", None)
+                        self._evict_sample_caches([c.get("id")])
                         if key:
                             affected_profiles.add(key)
 
@@ -1028,6 +1408,8 @@ class ProfileStore:
             return 0
 
         processed_count = 0
+        # Trimming below rewrites power_data in place under the same cycle ids
+        self._invalidate_sample_caches()
 
         # 1. Update Signatures & Optimize Data
         for cycle in cycles:
@@ -1065,7 +1447,7 @@ class ProfileStore:
                     if first_offset > 0:
                         # Leading zeros removed - Must shift start_time forward
                         try:
-                            start_dt = datetime.fromisoformat(cycle["start_time"])
+                            start_dt = _parse_iso(cycle["start_time"])
                             new_start = start_dt + timedelta(seconds=first_offset)
                             cycle["start_time"] = new_start.isoformat()
                             
@@ -1102,17 +1484,9 @@ class ProfileStore:
 
             if cycle.get("power_data"):
                 try:
-                    tuples = decompress_power_data(cycle)
-                    if tuples and len(tuples) > 10:
-                        start_ts = datetime.fromisoformat(cycle["start_time"]).timestamp()
-                        ts_arr = []
-                        p_arr = []
-                        for t_str, p in tuples:
-                            t = datetime.fromisoformat(t_str).timestamp()
-                            ts_arr.append(t - start_ts)
-                            p_arr.append(p)
-
-                        sig = compute_signature(np.array(ts_arr), np.array(p_arr))
+                    ts_arr, p_arr = relative_power_arrays(cycle)
+                    if len(ts_arr) > 10:
+                        sig = compute_signature(ts_arr, p_arr)
                         cycle["signature"] = dataclasses.asdict(sig)
                         processed_count += 1
                 except Exception as e: # pylint: disable=broad-exception-caught
@@ -1160,7 +1534,7 @@ class ProfileStore:
                 file_size_kb = os.path.getsize(self._store.path) / 1024
             else:
                 # Fallback: estimate
-                file_size_kb = len(json.dumps(self._data, default=str)) / 1024
+                file_size_kb = len(json_bytes(self._data)) / 1024
         except Exception:  # pylint: disable=broad-exception-caught
             pass
 
@@ -1255,6 +1629,9 @@ class ProfileStore:
         Build/rebuild statistical envelope for a profile asynchronously.
         Offloads heavy DTW/normalization to executor.
         """
+        # Sample data may have changed along with the envelope inputs
+        self._invalidate_sample_caches()
+
         # 1. Gather Data (Main Thread)
         labeled_cycles = [
             c
@@ -1472,19 +1849,18 @@ class ProfileStore:
             if len(pairs) < 3:
                 continue
 
-            offsets = [p[0] for p in pairs]
-            values = [p[1] for p in pairs]
-
-            if not offsets:
-                continue
+            offsets = np.asarray([p[0] for p in pairs])
+            values = np.asarray([p[1] for p in pairs])
 
             # Assign color
             color = palette[i % len(palette)]
             cycle_metadata[cid] = color
 
-            # Subsample for rendering performance
-            step = max(1, len(pairs) // 500)
-            subsampled_points = [(offsets[j], values[j]) for j in range(0, len(pairs), step)]
+            # Shape-preserving subsample for rendering performance
+            keep = lttb_indices(offsets, values, 500)
+            subsampled_points = list(
+                zip(offsets[keep].tolist(), values[keep].tolist())
+            )
 
             svg_curves.append(SVGCurve(
                 points=subsampled_points,
@@ -1577,6 +1953,36 @@ class ProfileStore:
             return cast(JSONDict, env) if isinstance(env, dict) else None
         return None
 
+    def _invalidate_sample_caches(self) -> None:
+        """Drop cached sample arrays/segments after sample data or references change."""
+        self._cached_sample_segments.clear()
+        self._cached_sample_power.clear()
+
+    def _evict_sample_caches(self, cycle_ids: Any) -> None:
+        """Drop cached sample arrays/segments of cycles that were removed or rewritten."""
+        ids = {cid for cid in cycle_ids if cid}
+        if not ids:
+            return
+        for cid in ids:
+            self._cached_sample_power.pop(cid, None)
+        for key in [k for k in self._cached_sample_segments if k[0] in ids]:
+            del self._cached_sample_segments[key]
+
+    def _get_cached_sample_power(self, sample_cycle: CycleDict) -> np.ndarray | None:
+        """Get or compute the sample cycle's power values as float32, using cache."""
+        cycle_id = sample_cycle.get("id")
+        if cycle_id and cycle_id in self._cached_sample_power:
+            return self._cached_sample_power[cycle_id]
+
+        _, sample_p = relative_power_arrays(sample_cycle)
+        if not len(sample_p):
+            return None
+
+        sample_arr = sample_p.astype(np.float32)
+        if cycle_id:
+            self._cached_sample_power[cycle_id] = sample_arr
+        return sample_arr
+
     def _get_cached_sample_segment(
         self, sample_cycle: dict[str, Any], dt: float
     ) -> Segment | None:
@@ -1617,12 +2023,69 @@ class ProfileStore:
             _LOGGER.warning("Error caching sample segment %s: %s", cycle_id, e)
             return None
 
+    def _duration_ratio_ok(
+        self, current_duration: float, profile_duration: float
+    ) -> bool:
+        """Return False if the duration ratio rules a profile out (same rule as the worker)."""
+        if not profile_duration or profile_duration <= 0:
+            return True
+        ratio = current_duration / profile_duration
+        return self._min_duration_ratio <= ratio <= self._max_duration_ratio
+
+    def _resolve_profile_samples(
+        self,
+    ) -> tuple[list[tuple[str, JSONDict, CycleDict]], list[str]]:
+        """Resolve every profile to the cycle used as its matching sample.
+
+        Returns (resolved, skipped): resolved holds (name, profile, sample_cycle)
+        tuples, skipped holds reasons for profiles without a usable sample.
+        Batch callers resolve once and pass the result to async_match_profile.
+        """
+        cycles = cast(list[CycleDict], self._data["past_cycles"])
+
+        resolved: list[tuple[str, JSONDict, CycleDict]] = []
+        skipped: list[str] = []
+        # First usable labeled cycle per profile, built on first fallback
+        fallback: dict[str, CycleDict] | None = None
+        for name, profile in self._data["profiles"].items():
+            # Try sample_cycle_id first, fall back to any labeled cycle
+            sample_id = profile.get("sample_cycle_id")
+            sample_cycle = self.get_cycle(sample_id) if sample_id else None
+            # Fallback: find ANY completed cycle labeled with this profile
+            if not sample_cycle:
+                if fallback is None:
+                    fallback = {}
+                    for c in cycles:
+                        label = c.get("profile_name")
+                        if (label and label not in fallback
+                                and c.get("status") in ("completed", "force_stopped")
+                                and c.get("power_data")):
+                            fallback[label] = c
+                sample_cycle = fallback.get(name)
+            if not sample_cycle:
+                skipped.append(f"{name}: no sample cycle (sample_id={sample_id})")
+                continue
+            resolved.append((name, profile, sample_cycle))
+
+        return resolved, skipped
+
     async def async_match_profile(
         self,
-        current_power_data: list[tuple[str, float]] | list[tuple[datetime, float]],
+        current_power_data: (
+            list[tuple[str, float]]
+            | list[tuple[datetime, float]]
+            | list[tuple[float, float]]
+        ),
         current_duration: float,
+        profile_samples: (
+            tuple[list[tuple[str, JSONDict, CycleDict]], list[str]] | None
+        ) = None,
     ) -> MatchResult:
-        """Run profile matching asynchronously in executor."""
+        """Run profile matching asynchronously in executor.
+
+        profile_samples may carry a precomputed _resolve_profile_samples() result
+        so batch callers (auto-labeling) skip re-resolving samples per cycle.
+        """
         # 1. Prepare data in main thread (Access ProfileStore state safely)
 
         # Convert to list of floats for current power (uniform resampling)
@@ -1631,15 +2094,20 @@ class ProfileStore:
 
         # Pre-process current data
         try:
-            # Normalize input format
+            # Normalize input format straight into float arrays
             if isinstance(current_power_data[0][0], datetime):
-                t_start = cast(datetime, current_power_data[0][0]).timestamp()
-                ts_arr = np.array([(cast(datetime, x[0]).timestamp() - t_start) for x in current_power_data])
+                n_points = len(current_power_data)
+                ts_arr = np.fromiter(
+                    (cast(datetime, x[0]).timestamp() for x in current_power_data),
+                    dtype=float, count=n_points,
+                )
+                p_arr = np.fromiter(
+                    (x[1] for x in current_power_data), dtype=float, count=n_points
+                )
             else:
-                t_start = datetime.fromisoformat(cast(str, current_power_data[0][0])).timestamp()
-                ts_arr = np.array([(datetime.fromisoformat(cast(str, x[0])).timestamp() - t_start) for x in current_power_data])
-
-            p_arr = np.array([float(x[1]) for x in current_power_data])
+                # ISO strings (final match) or stored offsets: one batch parse
+                ts_arr, p_arr = raw_points_to_arrays(current_power_data)
+            ts_arr = ts_arr - ts_arr[0]
 
             # Resample current
             segments, used_dt = resample_adaptive(ts_arr, p_arr, min_dt=5.0, gap_s=21600.0)
@@ -1652,32 +2120,18 @@ class ProfileStore:
             current_power_list = current_seg.power.tolist()
 
             # Prepare Snapshots
+            if profile_samples is None:
+                profile_samples = self._resolve_profile_samples()
+            resolved, skipped = profile_samples
             snapshots = []
-            skipped_profiles = []
-            for name, profile in self._data["profiles"].items():
-                # Try sample_cycle_id first, fall back to any labeled cycle
-                sample_id = profile.get("sample_cycle_id")
-                sample_cycle = None
-                if sample_id:
-                    sample_cycle = next(
-                        (c for c in self._data["past_cycles"] if c["id"] == sample_id),
-                        None
-                    )
-                # Fallback: find ANY completed cycle labeled with this profile
-                if not sample_cycle:
-                    sample_cycle = next(
-                        (c for c in self._data["past_cycles"]
-                          if c.get("profile_name") == name
-                          and c.get("status") in ("completed", "force_stopped")
-                          and c.get("power_data")),
-                        None
-                    )
-                if not sample_cycle:
-                    skipped_profiles.append(
-                        f"{name}: no sample cycle (sample_id={sample_id})"
-                    )
+            skipped_profiles = list(skipped)
+            for name, profile, sample_cycle in resolved:
+                profile_duration = profile.get(
+                    "avg_duration", sample_cycle.get("duration", 0)
+                )
+                # Cheap duration-ratio reject before resampling the sample
+                if not self._duration_ratio_ok(current_duration, profile_duration):
                     continue
-
                 # Prepare sample segment (using cache)
                 sample_seg = self._get_cached_sample_segment(sample_cycle, used_dt)
                 if not sample_seg:
@@ -1687,9 +2141,7 @@ class ProfileStore:
                     continue
                 snapshots.append({
                     "name": name,
-                    "avg_duration": profile.get(
-                        "avg_duration", sample_cycle.get("duration", 0)
-                    ),
+                    "avg_duration": profile_duration,
                     "sample_power": sample_seg.power.tolist(),
                     "sample_dt": used_dt
                 })
@@ -1711,19 +2163,22 @@ class ProfileStore:
             _LOGGER.error("Preparation for async match failed: %s", e)
             return MatchResult(None, 0.0, 0.0, None, [], False, 0.0)
 
-        # 2. Run Heavy Logic in Executor
-        candidates = await self.hass.async_add_executor_job(
-            analysis.compute_matches_worker,
-            current_power_list,
-            current_duration,
-            snapshots,
-            config
-        )
+        # 2. Run Heavy Logic in Executor (nothing to score if every profile
+        # was pruned by the duration ratio)
+        candidates = []
+        if snapshots:
+            candidates = await self.hass.async_add_executor_job(
+                analysis.compute_matches_worker,
+                current_power_list,
+                current_duration,
+                snapshots,
+                config
+            )
 
         # 3. Process Result (Main Thread)
         if not candidates:
             profiles_count = len(self._data.get("profiles", {}))
-            snapshots_count = len(snapshots) if 'snapshots' in dir() else 0
+            snapshots_count = len(snapshots)
             _LOGGER.debug(
                 "No profile match candidates: profiles=%d, snapshots=%d, "
                 "duration=%.0fs. Possible reasons: duration ratio filter, "
@@ -1776,19 +2231,23 @@ class ProfileStore:
         # Accessing self._data in thread is generally safe for reads if not modifying
         for name, profile in self._data["profiles"].items():
             sample_id = profile.get("sample_cycle_id")
-            sample_cycle = next((c for c in self._data["past_cycles"] if c["id"] == sample_id), None)
+            sample_cycle = self.get_cycle(sample_id) if sample_id else None
             if not sample_cycle:
                 continue
 
-            # Decompress sample data
-            sample_p_data = self._decompress_power_data(sample_cycle)
-            if not sample_p_data:
+            profile_duration = profile.get("avg_duration", sample_cycle.get("duration", 0))
+            if not self._duration_ratio_ok(duration, profile_duration):
+                continue
+
+            # Decompressed sample power (cached per sample cycle)
+            sample_power = self._get_cached_sample_power(sample_cycle)
+            if sample_power is None:
                 continue
 
             snapshots.append({
                 "name": name,
-                "avg_duration": profile.get("avg_duration", sample_cycle.get("duration", 0)),
-                "sample_power": [x[1] for x in sample_p_data],
+                "avg_duration": profile_duration,
+                "sample_power": sample_power,
             })
 
         config = {
@@ -1921,9 +2380,7 @@ class ProfileStore:
 
     async def create_profile(self, name: str, source_cycle_id: str) -> None:
         """Create a new profile from a past cycle."""
-        cycle = next(
-            (c for c in self._data["past_cycles"] if c["id"] == source_cycle_id), None
-        )
+        cycle = self.get_cycle(source_cycle_id)
         if not cycle:
             raise ValueError("Cycle not found")
 
@@ -1933,6 +2390,7 @@ class ProfileStore:
             "avg_duration": cycle["duration"],
             "sample_cycle_id": source_cycle_id,
         }
+        self._invalidate_sample_caches()
 
         # Save to persist the label
         await self.async_save()
@@ -1991,10 +2449,7 @@ class ProfileStore:
 
         profile_data: JSONDict = {}
         if reference_cycle_id:
-            cycle = next(
-                (c for c in self._data["past_cycles"] if c["id"] == reference_cycle_id),
-                None,
-            )
+            cycle = self.get_cycle(reference_cycle_id)
             if cycle:
                 profile_data = {
                     "avg_duration": cycle["duration"],
@@ -2007,6 +2462,7 @@ class ProfileStore:
 
         # Create profile with minimal data (will be updated when cycles are labeled)
         self._data.setdefault("profiles", {})[name] = profile_data
+        self._invalidate_sample_caches()
         await self.async_save()
         _LOGGER.info("Created standalone profile '%s'", name)
 
@@ -2037,6 +2493,7 @@ class ProfileStore:
             renamed = True
 
         target_name = new_name if renamed else old_name
+        self._invalidate_sample_caches()
 
         # Handle Duration Update
         if avg_duration is not None and avg_duration > 0:
@@ -2096,6 +2553,7 @@ class ProfileStore:
         """Clear all profiles and cycle data."""
         self._data["past_cycles"] = []
         self._data["profiles"] = {}
+        self._invalidate_sample_caches()
         await self.async_save()
         _LOGGER.info("Cleared all WashData storage")
 
@@ -2104,9 +2562,7 @@ class ProfileStore:
     ) -> None:
         """Assign an existing profile to a cycle. Rebuilds envelope."""
         old_profile = None
-        cycle = next(
-            (c for c in self._data["past_cycles"] if c["id"] == cycle_id), None
-        )
+        cycle = self.get_cycle(cycle_id)
         if not cycle:
             raise ValueError(f"Cycle {cycle_id} not found")
 
@@ -2162,6 +2618,9 @@ class ProfileStore:
 
         stats["total"] = len(target_cycles)
 
+        # Resolve profile samples once for the whole pass instead of per cycle
+        profile_samples = self._resolve_profile_samples()
+
         for cycle in target_cycles:
             # Reconstruct power data for matching
             power_data = self._decompress_power_data(cycle)
@@ -2170,7 +2629,9 @@ class ProfileStore:
                 continue
 
             # Try to match
-            result = await self.async_match_profile(power_data, cycle["duration"])
+            result = await self.async_match_profile(
+                power_data, cycle["duration"], profile_samples
+            )
 
             if result.best_profile and result.confidence >= confidence_threshold:
                 current_label = cycle.get("profile_name")
@@ -2292,6 +2753,7 @@ class ProfileStore:
 
         # Apply Split (Main Thread)
         cycles.pop(idx)
+        self._evict_sample_caches([cycle_id])
         new_ids = []
         original_profile = cycle.get("profile_name")
         start_dt_base_parsed = dt_util.parse_datetime(cycle["start_time"])
@@ -2303,44 +2765,20 @@ class ProfileStore:
         start_dt_base: datetime = start_dt_base_parsed
         start_ts = start_dt_base.timestamp()
 
-        # Use decompress_power_data which handles all format variations
-        p_data_tuples = self._decompress_power_data(cycle)
+        # Relative seconds (same frame as `seg_ranges`), sorted for binary search
+        ts_arr, p_arr = relative_power_arrays(cycle)
 
-        if not p_data_tuples:
+        if not len(ts_arr):
             _LOGGER.warning("Failed to decompress data during split for %s", cycle_id)
             return [cycle_id]
 
-        # Convert to relative seconds for array logic
-        # decompress_power_data returns list[tuple[str, float]] (ISO strings)
-        # We need relative seconds for the `seg_ranges` which are inputs in seconds.
-
-        points = []
-        for t_str, val in p_data_tuples:
-            dt_p = dt_util.parse_datetime(t_str)
-            if dt_p:
-                rel = dt_p.timestamp() - start_ts
-                points.append((rel, float(val)))
-
         for seg_start, seg_end in seg_ranges:
             # Construct new cycle logic
             seg_dur = seg_end - seg_start
             new_cycle_start = start_dt_base + timedelta(seconds=seg_start)
-            new_cycle_start_ts = new_cycle_start.timestamp()
 
             # Extract points
-            p_data_abs = []
-            state_val = 0.0
-            for t, p in points:
-                if t <= seg_start:
-                    state_val = p
-                else:
-                    break
-            p_data_abs.append([round(new_cycle_start_ts, 1), state_val])
-
-            for t, p in points:
-                if seg_start < t <= seg_end:
-                    if start_dt_base:
-                        p_data_abs.append([round(start_dt_base.timestamp() + t, 1), p])
+            p_data_abs = slice_segment_points(ts_arr, p_arr, seg_start, seg_end, start_ts)
 
             new_cycle = {
                 "start_time": new_cycle_start.isoformat(),
@@ -2357,7 +2795,8 @@ class ProfileStore:
         original_sample_id = cycle.get("id")
         best_replacement_id = None
         longest_dur = 0
-        new_cycles_objs = [c for c in cycles if c["id"] in new_ids]
+        new_id_set = set(new_ids)
+        new_cycles_objs = [c for c in cycles if c["id"] in new_id_set]
 
         for c in new_cycles_objs:
             d = c.get("duration", 0)
@@ -2412,10 +2851,11 @@ class ProfileStore:
             "new_value": new_value,
             "reason": reason,
         }
-        self._data.setdefault("auto_adjustments", []).append(adjustment)
-        # Keep last 50 adjustments
-        if len(self._data["auto_adjustments"]) > 50:
-            self._data["auto_adjustments"] = self._data["auto_adjustments"][-50:]
+        adjustments = self._data.setdefault("auto_adjustments", [])
+        adjustments.append(adjustment)
+        # Keep last 50 adjustments (trimmed in place, no new list per call)
+        if len(adjustments) > 50:
+            del adjustments[:-50]
         _LOGGER.info(
             "Auto-adjustment: %s changed from %s to %s (%s)",
             setting_name,
@@ -2440,30 +2880,28 @@ class ProfileStore:
 
     async def async_import_data(self, payload: dict[str, Any]) -> dict[str, Any]:
         # Import data from JSON payload (migration aware).
-        version = payload.get("version", 1)
-
-        # Handle v1 format (flat structure) - convert to v2
-        if version == 1 or "data" not in payload:
-            # V1 format had profiles/past_cycles at top level
-            data_dict = {
-                "profiles": payload.get("profiles", {}),
-                "past_cycles": payload.get("past_cycles", []),
-                "envelopes": payload.get("envelopes", {}),
+        # v1 exports are flat (profiles/past_cycles/envelopes at top level),
+        # v2 nests everything under "data"
+        is_v1 = payload.get("version", 1) == 1 or "data" not in payload
+        if is_v1:
+            data_dict: JSONDict = {
+                key: payload.get(key, default)
+                for key, default in (("profiles", {}), ("past_cycles", []), ("envelopes", {}))
             }
-            _LOGGER.info(
-                "Importing v1 format: %s cycles", len(data_dict.get("past_cycles", []))
-            )
         else:
-            # V2 format with nested "data" key
-            data = payload.get("data")
+            data = payload["data"]
             if not isinstance(data, dict):
                 raise ValueError(
                     "Invalid export payload (missing or invalid 'data' key)"
                 )
             data_dict = cast(JSONDict, data)
-            _LOGGER.info(
-                "Importing v2 format: %s cycles", len(data_dict.get("past_cycles", []))
-            )
+
+        cycles_raw = data_dict.get("past_cycles")
+        _LOGGER.info(
+            "Importing v%s format: %s cycles",
+            1 if is_v1 else 2,
+            len(cycles_raw) if isinstance(cycles_raw, list) else 0,
+        )
 
         # Validate and repair structure
         if not isinstance(data_dict.get("profiles"), dict):
@@ -2473,6 +2911,7 @@ class ProfileStore:
         data_dict.setdefault("envelopes", {})
 
         self._data = data_dict
+        self._invalidate_sample_caches()
         await self.async_save()
 
 
@@ -2480,12 +2919,13 @@ class ProfileStore:
         """Delete a cycle by ID."""
         cycles = cast(list[CycleDict], self._data.get("past_cycles", []))
         initial_len = len(cycles)
-        cycle_to_delete = next((c for c in cycles if c.get("id") == cycle_id), None)
+        cycle_to_delete = self.get_cycle(cycle_id)
         if not cycle_to_delete:
             return False
             
         profile_name = cycle_to_delete.get("profile_name")
         self._data["past_cycles"] = [c for c in cycles if c.get("id") != cycle_id]
+        self._evict_sample_caches([cycle_id])
         
         if len(self._data["past_cycles"]) < initial_len:
             # Check profile references
@@ -2505,42 +2945,21 @@ class ProfileStore:
         self, cycle: CycleDict, min_gap_s: int = 900, idle_power: float = 2.0
     ) -> list[tuple[float, float]]:
         """Analyze cycle for potential splits (sync for executor)."""
-        p_data = self._decompress_power_data(cycle)
-        if not p_data:
+        ts_arr, p_arr = relative_power_arrays(cycle)
+        if not len(ts_arr):
             return []
-            
-        start_ts = dt_util.parse_datetime(cycle["start_time"]).timestamp()
-        
-        # Parse all points to (rel_t, power)
-        points = []
-        for t_str, val in p_data:
-            dt_p = dt_util.parse_datetime(t_str)
-            if dt_p:
-                points.append((dt_p.timestamp() - start_ts, float(val)))
-               
-        if not points:
-            return []
-            
-        valid_segments = []
-        seg_start = 0.0
-        
-        for i in range(1, len(points)):
-            t, _ = points[i]
-            prev_t, prev_p = points[i-1]
-            
-            # Detect idle gap
-            gap = t - prev_t
-            if prev_p < idle_power and gap > min_gap_s:
-                # Segment ending at prev_t
-                if (prev_t - seg_start) > 60:
-                    valid_segments.append((seg_start, prev_t))
-                seg_start = t
-
-        # Last segment
-        last_t = points[-1][0]
-        if (last_t - seg_start) > 60:
-            valid_segments.append((seg_start, last_t))
-             
+
+        # A cut sits before sample i when sample i-1 is idle and the gap is long
+        cuts = np.flatnonzero(
+            (p_arr[:-1] < idle_power) & (np.diff(ts_arr) > min_gap_s)
+        ) + 1
+        seg_starts = np.concatenate(([0.0], ts_arr[cuts]))
+        seg_ends = np.concatenate((ts_arr[cuts - 1], ts_arr[-1:]))
+        keep = (seg_ends - seg_starts) > 60
+        valid_segments = list(
+            zip(seg_starts[keep].tolist(), seg_ends[keep].tolist())
+        )
+
         if len(valid_segments) < 2:
             return []
             
@@ -2567,6 +2986,7 @@ class ProfileStore:
 
         cycle = cycles[idx]
         cycles.pop(idx) # Remove original
+        self._evict_sample_caches([cycle_id])
         
         new_ids = []
         original_profile = cycle.get("profile_name")
@@ -2576,19 +2996,11 @@ class ProfileStore:
             
         start_ts = start_dt_base_parsed.timestamp()
 
-        # Decompress original data
-        p_data_tuples = self._decompress_power_data(cycle)
-        if not p_data_tuples:
+        # Original data as sorted relative seconds
+        ts_arr, p_arr = relative_power_arrays(cycle)
+        if not len(ts_arr):
             return []
 
-        # Prepare points (relative seconds)
-        points = []
-        for t_str, val in p_data_tuples:
-            dt_p = dt_util.parse_datetime(t_str)
-            if dt_p:
-                rel = dt_p.timestamp() - start_ts
-                points.append((rel, float(val)))
-
         # Create new cycles
         for seg in segments:
             if isinstance(seg, (list, tuple)):
@@ -2602,28 +3014,11 @@ class ProfileStore:
             
             seg_dur = seg_end - seg_start
             new_cycle_start = start_dt_base_parsed + timedelta(seconds=seg_start)
-            new_cycle_start_ts = new_cycle_start.timestamp()
 
-            # Extract points for this segment
-            p_data_abs = []
-            
-            # Find closest state before/at start to ensure continuity?
-            # Or just take points strictly inside?
-            # Generally better to capture the state at start 0.
-            state_val = 0.0
-            for t, p in points:
-                if t <= seg_start:
-                    state_val = p
-                else:
-                    break
-            
-            # Start point (t=0 relative to new cycle)
-            p_data_abs.append([round(new_cycle_start_ts, 1), state_val])
+            # Extract points for this segment, starting with the state at
+            # seg_start (t=0 relative to new cycle) for continuity
+            p_data_abs = slice_segment_points(ts_arr, p_arr, seg_start, seg_end, start_ts)
 
-            for t, p in points:
-                if seg_start < t <= seg_end:
-                    p_data_abs.append([round(start_ts + t, 1), p])
-            
             # Create Cycle Record
             new_cycle = {
                 "start_time": new_cycle_start.isoformat(),
@@ -2640,7 +3035,8 @@ class ProfileStore:
         original_sample_id = cycle.get("id")
         best_replacement_id = None
         longest_dur = 0
-        new_cycles_objs = [c for c in cycles if c["id"] in new_ids] # 'cycles' is mutated by add_cycle
+        new_id_set = set(new_ids)
+        new_cycles_objs = [c for c in cycles if c["id"] in new_id_set] # 'cycles' is mutated by add_cycle
 
         for c in new_cycles_objs:
             d = c.get("duration", 0)
@@ -2671,7 +3067,8 @@ class ProfileStore:
             return None
 
         cycles = self.get_past_cycles()
-        target_cycles = [c for c in cycles if c.get("id") in cycle_ids]
+        wanted_ids = set(cycle_ids)
+        target_cycles = [c for c in cycles if c.get("id") in wanted_ids]
         
         if len(target_cycles) != len(cycle_ids):
             return None
@@ -2696,30 +3093,20 @@ class ProfileStore:
         if not c1_start_dt:
             return None
 
-        # Helper to get parsed points from a cycle
-        def get_points(cy: CycleDict) -> list[tuple[float, float, float]]:
-            # content: [(timestamp, offset, power)]
-            raw = self._decompress_power_data(cy)
-            res = []
-            if not raw:
-                return []
-            base_t = dt_util.parse_datetime(cy["start_time"]).timestamp()
-            for t_str, val in raw:
-                dt_pt = dt_util.parse_datetime(t_str)
-                if dt_pt:
-                    t_abs = dt_pt.timestamp()
-                    res.append((t_abs, t_abs - base_t, float(val)))
-            return res
-
-        # Start with C1 points
-        merged_points_abs: list[list[float]] = [] # [timestamp, power]
-        
-        # Add C1 points
-        c1_pts = get_points(c1)
-        for t_abs, _, p in c1_pts:
-            merged_points_abs.append([t_abs, p])
-        
-        last_t_abs = c1_pts[-1][0] if c1_pts else c1_start_dt.timestamp()
+        # Helper to get absolute points from a cycle
+        def get_points(cy: CycleDict) -> tuple[np.ndarray, np.ndarray]:
+            # content: (timestamps, powers), straight from the stored offsets
+            offsets, powers = relative_power_arrays(cy)
+            if not len(offsets):
+                return np.empty(0), np.empty(0)
+            return offsets + parse_iso_ts(cy["start_time"]), powers
+
+        # Start with C1 points; pieces are concatenated once at the end
+        c1_ts, c1_p = get_points(c1)
+        ts_parts: list[np.ndarray] = [c1_ts]
+        p_parts: list[np.ndarray] = [c1_p]
+
+        last_t_abs = float(c1_ts[-1]) if len(c1_ts) else c1_start_dt.timestamp()
 
         # Iterate others
         max_power = c1.get("max_power", 0)
@@ -2729,23 +3116,23 @@ class ProfileStore:
             if not c_start_dt:
                 continue
             
-            c_pts = get_points(next_c)
-            if not c_pts:
+            c_ts, c_p = get_points(next_c)
+            if not len(c_ts):
                 continue
             
-            current_start_ts = c_pts[0][0]
+            current_start_ts = float(c_ts[0])
             
             # --- GAP FILLING ---
             gap = current_start_ts - last_t_abs
             # If gap > 1s, inject 0W points to ensure graph drops to 0
             if gap > 1.0:
-                merged_points_abs.append([last_t_abs + 0.1, 0.0])
-                merged_points_abs.append([current_start_ts - 0.1, 0.0])
+                ts_parts.append(np.array([last_t_abs + 0.1, current_start_ts - 0.1]))
+                p_parts.append(np.zeros(2))
             
             # Append points
-            for t_abs, _, p in c_pts:
-                merged_points_abs.append([t_abs, p])
-                last_t_abs = t_abs
+            ts_parts.append(c_ts)
+            p_parts.append(c_p)
+            last_t_abs = float(c_ts[-1])
             
             max_power = max(max_power, next_c.get("max_power", 0))
 
@@ -2759,22 +3146,22 @@ class ProfileStore:
         c1["profile_name"] = target_profile
         
         # Generate new compressed power_data [offset, power]
-        new_power_data = []
-        c1_start_ts = c1_start_dt.timestamp()
-        
-        for t_abs, p in merged_points_abs:
-            offset = round(t_abs - c1_start_ts, 1)
-            new_power_data.append([offset, float(p)])
+        merged_offsets = np.round(np.concatenate(ts_parts) - c1_start_dt.timestamp(), 1)
+        merged_powers = np.concatenate(p_parts)
+        if len(merged_powers):
+            c1["max_power"] = max(max_power, round(float(np.max(merged_powers)), 1))
+        new_power_data = np.column_stack((merged_offsets, merged_powers)).tolist()
         
         c1["power_data"] = new_power_data
         
         # New Hash ID
-        new_id = hashlib.sha256(f"{c1['start_time']}_{c1['duration']}".encode()).hexdigest()[:12]
+        new_id = make_cycle_id(c1["start_time"], c1["duration"])
         old_c1_id = c1["id"]
         c1["id"] = new_id
         
         # Update references in profiles
         all_removed_ids = ids_to_remove + [old_c1_id]
+        self._evict_sample_caches(all_removed_ids)
         for p_data in self.get_profiles().values():
             if p_data.get("sample_cycle_id") in all_removed_ids:
                 p_data["sample_cycle_id"] = new_id
@@ -2786,10 +3173,8 @@ class ProfileStore:
         
         # Update signature
         try:
-            ts_arr = np.array([pt[0] for pt in new_power_data])
-            p_arr = np.array([pt[1] for pt in new_power_data])
-            if len(ts_arr) > 1:
-                sig = compute_signature(ts_arr, p_arr)
+            if len(merged_offsets) > 1:
+                sig = compute_signature(merged_offsets, merged_powers)
                 c1["signature"] = dataclasses.asdict(sig)
         except Exception as e:  # pylint: disable=broad-exception-caught
             _LOGGER.warning("Failed to update signature for merged cycle %s: %s", new_id, e)
@@ -2807,20 +3192,14 @@ class ProfileStore:
         self, cycle_id: str, segments: list[tuple[float, float]], width: int = 600, height: int = 300
     ) -> str:
         """Generate SVG for split preview."""
-        cycle = next((c for c in self.get_past_cycles() if c["id"] == cycle_id), None)
+        cycle = self.get_cycle(cycle_id)
         if not cycle:
             return ""
 
-        p_data = self._decompress_power_data(cycle)
-        if not p_data:
+        ts_arr, p_arr = relative_power_arrays(cycle)
+        if not len(ts_arr):
             return ""
-        
-        start_ts = dt_util.parse_datetime(cycle["start_time"]).timestamp()
-        points = []
-        for t_str, val in p_data:
-            t = dt_util.parse_datetime(t_str)
-            if t:
-                points.append((t.timestamp() - start_ts, float(val)))
+        points = list(zip(ts_arr.tolist(), p_arr.tolist()))
         
         curves = [SVGCurve(points=points, color="#9E9E9E", opacity=0.5)] # Base ghost
         markers = []
@@ -2828,7 +3207,8 @@ class ProfileStore:
         # Highlight Segments
         colors = ["#2196F3", "#4CAF50", "#FF9800", "#9C27B0"]
         for i, (seg_start, seg_end) in enumerate(segments):
-            seg_pts = [(t, p) for t, p in points if seg_start <= t <= seg_end]
+            in_seg = (ts_arr >= seg_start) & (ts_arr <= seg_end)
+            seg_pts = list(zip(ts_arr[in_seg].tolist(), p_arr[in_seg].tolist()))
             if seg_pts:
                 color = colors[i % len(colors)]
                 curves.append(SVGCurve(points=seg_pts, color=color, stroke_width=2))
@@ -2840,7 +3220,8 @@ class ProfileStore:
         self, cycle_ids: list[str], width: int = 600, height: int = 300
     ) -> str:
         """Generate SVG for merge preview."""
-        cycles = [c for c in self.get_past_cycles() if c["id"] in cycle_ids]
+        wanted_ids = set(cycle_ids)
+        cycles = [c for c in self.get_past_cycles() if c["id"] in wanted_ids]
         cycles.sort(key=lambda c: str(c.get("start_time", "")))
         
         if not cycles:
@@ -2852,15 +3233,11 @@ class ProfileStore:
         colors = ["#2196F3", "#FF9800", "#4CAF50", "#9C27B0"]
         
         for i, c in enumerate(cycles):
-            p_data = self._decompress_power_data(c)
-            if not p_data:
+            ts_arr, p_arr = relative_power_arrays(c)
+            if not len(ts_arr):
                 continue
-            points = []
-            for t_str, val in p_data:
-                t = dt_util.parse_datetime(t_str)
-                if t:
-                    rel_t = t.timestamp() - first_start
-                    points.append((rel_t, float(val)))
+            rel_t = ts_arr + (parse_iso_ts(c["start_time"]) - first_start)
+            points = list(zip(rel_t.tolist(), p_arr.tolist()))
             
             if points:
                 curves.append(SVGCurve(points=points, color=colors[i % len(colors)], stroke_width=2))
@@ -9,7 +9,7 @@ from homeassistant.const import EntityCategory
 from homeassistant.helpers import entity_registry
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.util import dt as dt_util, slugify
+from homeassistant.util import slugify
 
 from .const import DOMAIN, SIGNAL_WASHER_UPDATE, CONF_EXPOSE_DEBUG_ENTITIES
 from .manager import WashDataManager
@@ -87,12 +87,9 @@ class WasherBaseSensor(SensorEntity):
 class WasherStateSensor(WasherBaseSensor):
     """Sensor for the washing machine state."""
 
-    def __init__(self, manager, entry):
-        """Initialize the state sensor."""
-        self.entity_description = SensorEntityDescription(
-            key="washer_state", name="State"
-        )
-        super().__init__(manager, entry)
+    entity_description = SensorEntityDescription(
+        key="washer_state", name="State"
+    )
 
     @property
     def icon(self) -> str | None:
@@ -124,12 +121,9 @@ class WasherStateSensor(WasherBaseSensor):
 class WasherProgramSensor(WasherBaseSensor):
     """Sensor for the current program."""
 
-    def __init__(self, manager, entry):
-        """Initialize the program sensor."""
-        self.entity_description = SensorEntityDescription(
-            key="washer_program", name="Program", icon="mdi:file-document-outline"
-        )
-        super().__init__(manager, entry)
+    entity_description = SensorEntityDescription(
+        key="washer_program", name="Program", icon="mdi:file-document-outline"
+    )
 
     @property
     def native_value(self):
@@ -139,15 +133,12 @@ class WasherProgramSensor(WasherBaseSensor):
 class WasherTimeRemainingSensor(WasherBaseSensor):
     """Sensor for estimated time remaining."""
 
-    def __init__(self, manager, entry):
-        """Initialize the time remaining sensor."""
-        self.entity_description = SensorEntityDescription(
-            key="time_remaining",
-            name="Time Remaining",
-            # native_unit_of_measurement="min",  # Removed static unit
-            icon="mdi:timer-sand",
-        )
-        super().__init__(manager, entry)
+    entity_description = SensorEntityDescription(
+        key="time_remaining",
+        name="Time Remaining",
+        # native_unit_of_measurement="min",  # Removed static unit
+        icon="mdi:timer-sand",
+    )
 
     @property
     def native_unit_of_measurement(self) -> str | None:
@@ -168,15 +159,12 @@ class WasherTimeRemainingSensor(WasherBaseSensor):
 class WasherTotalDurationSensor(WasherBaseSensor):
     """Sensor for total predicted duration."""
 
-    def __init__(self, manager, entry):
-        """Initialize the total duration sensor."""
-        self.entity_description = SensorEntityDescription(
-            key="total_duration",
-            name="Total Duration",
-            device_class="duration",
-            icon="mdi:timer-check-outline",
-        )
-        super().__init__(manager, entry)
+    entity_description = SensorEntityDescription(
+        key="total_duration",
+        name="Total Duration",
+        device_class="duration",
+        icon="mdi:timer-check-outline",
+    )
 
     @property
     def native_unit_of_measurement(self) -> str | None:
@@ -204,16 +192,13 @@ class WasherTotalDurationSensor(WasherBaseSensor):
 class WasherProgressSensor(WasherBaseSensor):
     """Sensor for cycle progress percentage."""
 
-    def __init__(self, manager, entry):
-        """Initialize the progress sensor."""
-        self.entity_description = SensorEntityDescription(
-            key="cycle_progress",
-            name="Progress",
-            native_unit_of_measurement="%",
-            suggested_display_precision=1,
-            icon="mdi:progress-clock",
-        )
-        super().__init__(manager, entry)
+    entity_description = SensorEntityDescription(
+        key="cycle_progress",
+        name="Progress",
+        native_unit_of_measurement="%",
+        suggested_display_precision=1,
+        icon="mdi:progress-clock",
+    )
 
     @property
     def native_value(self):
@@ -223,16 +208,13 @@ class WasherProgressSensor(WasherBaseSensor):
 class WasherPowerSensor(WasherBaseSensor):
     """Sensor for current power usage."""
 
-    def __init__(self, manager, entry):
-        """Initialize the power sensor."""
-        self.entity_description = SensorEntityDescription(
-            key="current_power",
-            name="Current Power",
-            native_unit_of_measurement="W",
-            device_class="power",
-            icon="mdi:flash",
-        )
-        super().__init__(manager, entry)
+    entity_description = SensorEntityDescription(
+        key="current_power",
+        name="Current Power",
+        native_unit_of_measurement="W",
+        device_class="power",
+        icon="mdi:flash",
+    )
 
     @property
     def native_value(self):
@@ -242,41 +224,31 @@ class WasherPowerSensor(WasherBaseSensor):
 class WasherElapsedTimeSensor(WasherBaseSensor):
     """Sensor for elapsed cycle time."""
 
-    def __init__(self, manager, entry):
-        """Initialize the elapsed time sensor."""
-        self.entity_description = SensorEntityDescription(
-            key="elapsed_time",
-            name="Elapsed Time",
-            native_unit_of_measurement="s",
-            device_class="duration",
-            icon="mdi:timer-outline",
-        )
-        super().__init__(manager, entry)
+    entity_description = SensorEntityDescription(
+        key="elapsed_time",
+        name="Elapsed Time",
+        native_unit_of_measurement="s",
+        device_class="duration",
+        icon="mdi:timer-outline",
+    )
 
     @property
     def native_value(self):
         if self._manager.check_state == "off":
             return 0
-        start = self._manager.cycle_start_time
-        if start:
-            delta = dt_util.now() - start
-            return int(delta.total_seconds())
-        return 0
+        return self._manager.cycle_elapsed_seconds
 
 
 class WasherDebugSensor(WasherBaseSensor):
     """Sensor for internal debug information."""
 
-    def __init__(self, manager, entry):
-        """Initialize the debug sensor."""
-        self.entity_description = SensorEntityDescription(
-            key="debug_info",
-            name="Debug Info",
-            icon="mdi:bug",
-            entity_registry_enabled_default=False,  # Hidden by default
-            entity_category=EntityCategory.DIAGNOSTIC,
-        )
-        super().__init__(manager, entry)
+    entity_description = SensorEntityDescription(
+        key="debug_info",
+        name="Debug Info",
+        icon="mdi:bug",
+        entity_registry_enabled_default=False,  # Hidden by default
+        entity_category=EntityCategory.DIAGNOSTIC,
+    )
 
     @property
     def native_value(self):
@@ -305,16 +277,14 @@ class WasherDebugSensor(WasherBaseSensor):
 class WasherMatchConfidenceSensor(WasherBaseSensor):
     """Sensor for profile match confidence."""
 
-    def __init__(self, manager, entry):
-        self.entity_description = SensorEntityDescription(
-            key="match_confidence",
-            name="Match Confidence",
-            icon="mdi:chart-bar",
-            state_class="measurement",
-            native_unit_of_measurement="%",
-            entity_category=EntityCategory.DIAGNOSTIC,
-        )
-        super().__init__(manager, entry)
+    entity_description = SensorEntityDescription(
+        key="match_confidence",
+        name="Match Confidence",
+        icon="mdi:chart-bar",
+        state_class="measurement",
+        native_unit_of_measurement="%",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    )
 
     @property
     def native_value(self):
@@ -325,14 +295,12 @@ class WasherMatchConfidenceSensor(WasherBaseSensor):
 class WasherTopCandidatesSensor(WasherBaseSensor):
     """Sensor showing top matching candidates."""
 
-    def __init__(self, manager, entry):
-        self.entity_description = SensorEntityDescription(
-            key="top_candidates",
-            name="Top Candidates",
-            icon="mdi:format-list-numbered",
-            entity_category=EntityCategory.DIAGNOSTIC,
-        )
-        super().__init__(manager, entry)
+    entity_description = SensorEntityDescription(
+        key="top_candidates",
+        name="Top Candidates",
+        icon="mdi:format-list-numbered",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    )
 
     @property
     def native_value(self):
@@ -350,14 +318,12 @@ class WasherTopCandidatesSensor(WasherBaseSensor):
 class WasherPhaseSensor(WasherBaseSensor):
     """Sensor for current wash phase."""
 
-    def __init__(self, manager, entry):
-        self.entity_description = SensorEntityDescription(
-            key="wash_phase",
-            name="Phase",
-            icon="mdi:washing-machine-alert",
-            entity_category=EntityCategory.DIAGNOSTIC,
-        )
-        super().__init__(manager, entry)
+    entity_description = SensorEntityDescription(
+        key="wash_phase",
+        name="Phase",
+        icon="mdi:washing-machine-alert",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    )
 
     @property
     def native_value(self):
@@ -498,14 +464,12 @@ class WasherProfileSensorManager:
 class WasherSuggestionsSensor(WasherBaseSensor):
     """Sensor for learned settings suggestions."""
 
-    def __init__(self, manager, entry):
-        self.entity_description = SensorEntityDescription(
-            key="suggestions",
-            name="Suggested Settings",
-            icon="mdi:lightbulb-on-outline",
-            entity_category=EntityCategory.DIAGNOSTIC,
-        )
-        super().__init__(manager, entry)
+    entity_description = SensorEntityDescription(
+        key="suggestions",
+        name="Suggested Settings",
+        icon="mdi:lightbulb-on-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    )
 
     @property
     def native_value(self):
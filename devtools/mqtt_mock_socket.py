@@ -1,29 +1,45 @@
 """MQTT mock power socket for HA WashData dev/testing - Synthesis Only."""
 from __future__ import annotations
 import argparse
+import asyncio
+import atexit
+import functools
 import importlib.util
+import queue
 import random
+import socket
 import threading
 import time
 import json
 import os
 import logging
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import Future, TimeoutError as FutureTimeout
 from datetime import datetime
-import copy
-from collections import deque
+from pathlib import Path
+from collections import OrderedDict, defaultdict, deque
+from itertools import islice
 import sqlite3
 import base64
-import math
 
-from nicegui import ui, events
+from typing import TYPE_CHECKING
 
-import paho.mqtt.client as mqtt
+import numpy as np
+
+try:
+    import orjson  # Optional; parses the brush payloads faster
+except ImportError:
+    orjson = None
+
+# nicegui and paho are imported where used, so the synthesizer and DB
+# layer can be imported (tests, --help) without the UI/MQTT stack.
+if TYPE_CHECKING:
+    from nicegui import events
 
 # --- Configuration & Secrets ---
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_FILE = os.path.join(SCRIPT_DIR, "mock_socket.db")
 UPLOAD_DIR = os.path.join(SCRIPT_DIR, "uploaded_cycles")
-os.makedirs(UPLOAD_DIR, exist_ok=True)
 
 def load_secrets():
     for fname in ["mqtt_secrets.py", "priv_secrets.py"]:
@@ -53,18 +69,104 @@ AVAIL_TOPIC = f"{MQTT_DISCOVERY_PREFIX}/switch/{DEVICE_ID}/availability"
 SENSOR_STATE_TOPIC = f"{MQTT_DISCOVERY_PREFIX}/sensor/{DEVICE_ID}_power/state"
 SENSOR_CONFIG_TOPIC = f"{MQTT_DISCOVERY_PREFIX}/sensor/{DEVICE_ID}_power/config"
 SWITCH_CONFIG_TOPIC = f"{MQTT_DISCOVERY_PREFIX}/switch/{DEVICE_ID}/config"
+HISTORY_LIMIT = 20  # Cycles kept in the UI's session history
+MAX_SAMPLES_PER_CYCLE = 50000  # Newest readings kept per cycle for history
+
+# Discovery configs never change at runtime; serialize them once
+_DEVICE = {"identifiers": [DEVICE_ID], "name": DEVICE_NAME, "manufacturer": "HA WashData", "model": "Mock Socket"}
+DISCOVERY_SENSOR_PAYLOAD = json.dumps({"name": "Mock Washer Power", "state_topic": SENSOR_STATE_TOPIC, "availability_topic": AVAIL_TOPIC, "unit_of_measurement": "W", "device_class": "power", "state_class": "measurement", "unique_id": f"{DEVICE_ID}_power", "device": _DEVICE}).encode()
+DISCOVERY_SWITCH_PAYLOAD = json.dumps({"name": "Mock Washer Start", "command_topic": COMMAND_TOPIC, "state_topic": STATE_TOPIC, "availability_topic": AVAIL_TOPIC, "payload_on": "ON", "payload_off": "OFF", "unique_id": f"{DEVICE_ID}_switch", "device": _DEVICE}).encode()
+
+@functools.lru_cache(maxsize=4096)
+def format_timestamp(sec: int) -> str:
+    """Local 'YYYY-MM-DD HH:MM:SS' for an epoch second, cached."""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+
+def now_timestamp(now: float | None = None) -> str:
+    """Local 'YYYY-MM-DD HH:MM:SS', formatted at most once per second."""
+    return format_timestamp(int(time.time() if now is None else now))
+
+# Packed power_readings chunk: whole-second offset from start_ts + watts.
+# One row per clock hour (start_ts = hour start), so offsets fit in uint16.
+_READING_DTYPE = np.dtype([("dt", "<u2"), ("p", "<f4")])
+
+def pack_readings(rows: list[tuple[float, float]]) -> list[tuple[int, bytes]]:
+    """Pack time-ordered (epoch, power) samples into (hour_start, blob) chunks."""
+    arr = np.asarray(rows, dtype=np.float64)
+    secs = arr[:, 0].astype(np.int64)
+    hours = secs // 3600
+    bounds = np.flatnonzero(np.diff(hours)) + 1
+    chunks = []
+    for lo, hi in zip(np.r_[0, bounds], np.r_[bounds, len(arr)]):
+        start_ts = int(hours[lo]) * 3600
+        packed = np.empty(hi - lo, dtype=_READING_DTYPE)
+        packed["dt"] = secs[lo:hi] - start_ts
+        packed["p"] = arr[lo:hi, 1]
+        chunks.append((start_ts, packed.tobytes()))
+    return chunks
+
+def unpack_readings(start_ts: int, blob: bytes) -> tuple[np.ndarray, np.ndarray]:
+    """Inverse of one pack_readings chunk: (epoch seconds, watts) arrays."""
+    chunk = np.frombuffer(blob, dtype=_READING_DTYPE)
+    return chunk["dt"].astype(np.int64) + start_ts, chunk["p"].astype(np.float64)
 
 # --- Database Manager ---
+# Each flush appends to its hour's row instead of adding a row per flush
+_READING_INSERT = """
+    INSERT INTO power_readings_blob (start_ts, samples) VALUES (?, ?)
+    ON CONFLICT(start_ts) DO UPDATE SET samples = CAST(samples || excluded.samples AS BLOB)
+"""
+_LOG_INSERT = "INSERT INTO logs (timestamp, level, message) VALUES (?, ?, ?)"
+_STOP = object()
+
 class DBManager:
     def __init__(self, db_path):
         self.db_path = db_path
+        self._read_uri = Path(os.path.abspath(db_path)).as_uri() + "?mode=ro"
+        # Read-only connection per reader thread (UI, manager)
+        self._local = threading.local()
+        # Power readings are buffered and written in batches
+        self._reading_buffer: list[tuple[float, float]] = []
+        self._reading_lock = threading.Lock()
+        self._reading_flush_threshold = 64
+        self._reading_flush_interval = 5.0
+        self._last_reading_flush = time.monotonic()
+        # Log records are buffered too, flushed by the writer once a second
+        self._log_buffer: deque[tuple[str, str, str]] = deque(maxlen=500)
+        self._log_lock = threading.Lock()
+        # All writes go through one thread that owns the only writable connection
+        self._write_queue: queue.Queue = queue.Queue()
+        self._writer_conn = self._open_writer()
         self._init_db()
+        self._writer = threading.Thread(target=self._writer_loop, name="mock-socket-db-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _open_writer(self):
+        # IMMEDIATE: write transactions take the lock up front instead of
+        # upgrading mid-transaction and hitting SQLITE_BUSY
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level="IMMEDIATE")
+        # WAL lets UI reads run alongside the writer
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA wal_autocheckpoint=1000")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+        return conn
 
     def _get_conn(self):
-        return sqlite3.connect(self.db_path, check_same_thread=False)
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._read_uri, uri=True, check_same_thread=False)
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-64000")
+            self._local.conn = conn
+        return conn
 
     def _init_db(self):
-        with self._get_conn() as conn:
+        with self._writer_conn as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS settings (
                     key TEXT PRIMARY KEY,
@@ -90,128 +192,235 @@ class DBManager:
                     message TEXT
                 )
             """)
+            self._migrate_reading_chunks(conn)
             conn.execute("""
-                CREATE TABLE IF NOT EXISTS power_readings (
-                    timestamp TEXT,
-                    power REAL
+                CREATE TABLE IF NOT EXISTS power_readings_blob (
+                    start_ts INTEGER PRIMARY KEY,
+                    samples BLOB
                 )
             """)
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_power_time ON power_readings(timestamp)")
-            conn.commit()
+            self._migrate_text_readings(conn)
 
-    def save_setting(self, key, value):
+    @staticmethod
+    def _migrate_reading_chunks(conn):
+        """Merge the old per-flush power_readings_blob rows into hour rows."""
+        columns = conn.execute("PRAGMA table_info(power_readings_blob)").fetchall()
+        # table_info: (cid, name, type, notnull, default, pk)
+        if not columns or any(col[1] == "start_ts" and col[5] for col in columns):
+            return
+        rows = []
+        for start_ts, blob in conn.execute("SELECT start_ts, samples FROM power_readings_blob ORDER BY start_ts ASC, rowid ASC"):
+            secs, powers = unpack_readings(start_ts, blob)
+            rows.extend(zip(secs.tolist(), powers.tolist()))
+        conn.execute("DROP TABLE power_readings_blob")
+        conn.execute("""
+            CREATE TABLE power_readings_blob (
+                start_ts INTEGER PRIMARY KEY,
+                samples BLOB
+            )
+        """)
+        if rows:
+            conn.executemany(_READING_INSERT, pack_readings(rows))
+
+    @staticmethod
+    def _migrate_text_readings(conn):
+        """Fold the old one-row-per-sample power_readings table into hour chunks."""
+        if not conn.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='power_readings'").fetchone():
+            return
+        rows = []
+        for ts, power in conn.execute("SELECT timestamp, power FROM power_readings ORDER BY timestamp ASC"):
+            try:
+                rows.append((time.mktime(time.strptime(ts, "%Y-%m-%d %H:%M:%S")), float(power)))
+            except (TypeError, ValueError):
+                continue
+        if rows:
+            conn.executemany(_READING_INSERT, pack_readings(rows))
+        conn.execute("DROP TABLE power_readings")
+
+    # --- Writer thread ---
+    def _writer_loop(self):
+        conn = self._writer_conn
+        last_log_flush = time.monotonic()
+        while True:
+            try:
+                item = self._write_queue.get(timeout=1.0)
+            except queue.Empty:
+                item = None
+            now = time.monotonic()
+            if now - last_log_flush >= 1.0:
+                last_log_flush = now
+                self._execute(conn, _LOG_INSERT, self._take_logs(), "add_log")
+            if item is None:
+                continue
+            if item is _STOP:
+                self._write_queue.task_done()
+                break
+            sql, rows, label, done = item
+            result = self._execute(conn, sql, rows, label)
+            if done is not None:
+                done.set_result(result)
+            self._write_queue.task_done()
+
+    @staticmethod
+    def _execute(conn, sql, rows, label):
+        if not rows:
+            return None
         try:
-            with self._get_conn() as conn:
-                conn.execute("INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)", (key, json.dumps(value)))
-                conn.commit()
+            # One transaction per batch
+            with conn:
+                if len(rows) == 1:
+                    cur = conn.execute(sql, rows[0])
+                else:
+                    cur = conn.executemany(sql, rows)
+            return cur.lastrowid
         except Exception as e:
-            print(f"DB Error save_setting: {e}")
+            print(f"DB Error {label}: {e}")
+            return None
+
+    def _write(self, sql, rows, label, wait=False):
+        """Queue a write; with wait=True block until it (and all before it) ran."""
+        if not wait:
+            if rows:
+                self._write_queue.put((sql, rows, label, None))
+            return None
+        done = Future()
+        self._write_queue.put((sql, rows, label, done))
+        try:
+            return done.result(timeout=10.0)
+        except FutureTimeout:
+            print(f"DB Error {label}: writer timed out")
+            return None
+
+    def close(self):
+        if not self._writer.is_alive():
+            return
+        self.flush_power_readings()
+        self.flush_logs()
+        self._write_queue.put(_STOP)
+        self._writer.join(timeout=5.0)
+
+    def save_setting(self, key, value):
+        self._write("INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+                    [(key, json.dumps(value))], "save_setting")
 
     def load_setting(self, key, default=None):
         try:
-            with self._get_conn() as conn:
-                cur = conn.execute("SELECT value FROM settings WHERE key = ?", (key,))
-                row = cur.fetchone()
-                return json.loads(row[0]) if row else default
+            cur = self._get_conn().execute("SELECT value FROM settings WHERE key = ?", (key,))
+            row = cur.fetchone()
+            return json.loads(row[0]) if row else default
         except Exception as e:
             print(f"DB Error load_setting: {e}")
             return default
 
-    def add_history(self, entry: dict):
-        try:
-            with self._get_conn() as conn:
-                conn.execute("""
-                    INSERT INTO history (timestamp, profile, duration, status, settings, readings)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (
-                    entry['time'], 
-                    entry['profile'], 
-                    entry.get('duration_val', 0.0), 
-                    entry['status'], 
-                    json.dumps(entry['settings']), 
-                    json.dumps(entry['readings'])
-                ))
-                conn.commit()
-        except Exception as e:
-            print(f"DB Error add_history: {e}")
-
-    def get_recent_history(self, limit=20):
+    def add_history(self, entry: dict) -> int | None:
+        return self._write("""
+            INSERT INTO history (timestamp, profile, duration, status, settings, readings)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, [(
+            entry['time'], 
+            entry['profile'], 
+            entry.get('duration_val', 0.0), 
+            entry['status'], 
+            json.dumps(entry['settings'], separators=(',', ':')), 
+            json.dumps(entry['readings'], separators=(',', ':'))
+        )], "add_history", wait=True)
+
+    def get_recent_history_summary(self, limit=HISTORY_LIMIT):
+        """Recent history rows without the settings/readings blobs."""
         try:
-            with self._get_conn() as conn:
-                cur = conn.execute("SELECT id, timestamp, profile, duration, status, settings, readings FROM history ORDER BY id DESC LIMIT ?", (limit,))
-                rows = cur.fetchall()
-                history = []
-                for r in rows:
-                    history.append({
-                        "id": r[0],
-                        "time": r[1],
-                        "profile": r[2],
-                        "duration": f"{r[3]:.1f}s",
-                        "duration_val": r[3],
-                        "status": r[4],
-                        "settings": json.loads(r[5]),
-                        "readings": json.loads(r[6])
-                    })
-                return history
+            cur = self._get_conn().execute("SELECT id, timestamp, profile, duration, status FROM history ORDER BY id DESC LIMIT ?", (limit,))
+            rows = cur.fetchall()
+            history = []
+            for r in rows:
+                history.append({
+                    "id": r[0],
+                    "time": r[1],
+                    "profile": r[2],
+                    "duration": f"{r[3]:.1f}s",
+                    "duration_val": r[3],
+                    "status": r[4],
+                })
+            return history
         except Exception as e:
             print(f"DB Error get_history: {e}")
             return []
 
-    def delete_history_items(self, ids: list[int]):
+    def get_history_detail(self, entry_id: int) -> dict | None:
+        """Decoded settings and readings for one history row."""
         try:
-            if not ids:
-                return
-            placeholders = ','.join('?' for _ in ids)
-            with self._get_conn() as conn:
-                conn.execute(f"DELETE FROM history WHERE id IN ({placeholders})", ids)
-                conn.commit()
+            cur = self._get_conn().execute("SELECT settings, readings FROM history WHERE id = ?", (entry_id,))
+            row = cur.fetchone()
+            if not row:
+                return None
+            return {"settings": json.loads(row[0]), "readings": json.loads(row[1])}
         except Exception as e:
-            print(f"DB Error delete_history: {e}")
+            print(f"DB Error get_history_detail: {e}")
+            return None
+
+    def delete_history_items(self, ids: list[int]):
+        if not ids:
+            return
+        placeholders = ','.join('?' for _ in ids)
+        self._write(f"DELETE FROM history WHERE id IN ({placeholders})", [tuple(ids)],
+                    "delete_history", wait=True)
 
     def add_log(self, level, message):
-        try:
-            with self._get_conn() as conn:
-                conn.execute("INSERT INTO logs (timestamp, level, message) VALUES (?, ?, ?)", 
-                             (datetime.now().strftime("%Y-%m-%d %H:%M:%S"), level, message))
-                conn.commit()
-        except Exception as e:
-            print(f"DB Error add_log: {e}")
+        with self._log_lock:
+            self._log_buffer.append((now_timestamp(), level, message))
+
+    def _take_logs(self) -> list[tuple[str, str, str]]:
+        with self._log_lock:
+            rows = list(self._log_buffer)
+            self._log_buffer.clear()
+        return rows
+
+    def flush_logs(self):
+        self._write(_LOG_INSERT, self._take_logs(), "add_log", wait=True)
 
-        except Exception as e:
-            print(f"DB Error get_logs: {e}")
-            return []
     def get_recent_logs(self, limit=500):
+        self.flush_logs()
         try:
-            with self._get_conn() as conn:
-                cur = conn.execute("SELECT timestamp, message FROM logs ORDER BY id DESC LIMIT ?", (limit,))
-                rows = cur.fetchall()
-                return [f"{r[1]}" for r in reversed(rows)] 
+            cur = self._get_conn().execute("SELECT timestamp, message FROM logs ORDER BY id DESC LIMIT ?", (limit,))
+            rows = cur.fetchall()
+            return [f"{r[1]}" for r in reversed(rows)] 
         except Exception as e:
             print(f"DB Error get_logs: {e}")
             return []
 
-    def log_power_reading(self, power: float):
-        try:
-            with self._get_conn() as conn:
-                conn.execute("INSERT INTO power_readings (timestamp, power) VALUES (?, ?)", 
-                             (datetime.now().strftime("%Y-%m-%d %H:%M:%S"), power))
-                conn.commit()
-        except Exception as e:
-            print(f"DB Error log_power: {e}")
+    def log_power_reading(self, power: float, timestamp: float | None = None):
+        row = (time.time() if timestamp is None else timestamp, power)
+        with self._reading_lock:
+            self._reading_buffer.append(row)
+            if (len(self._reading_buffer) < self._reading_flush_threshold
+                    and time.monotonic() - self._last_reading_flush < self._reading_flush_interval):
+                return
+            rows, self._reading_buffer = self._reading_buffer, []
+            self._last_reading_flush = time.monotonic()
+        self._write(_READING_INSERT, pack_readings(rows), "log_power")
+
+    def flush_power_readings(self, wait=False):
+        with self._reading_lock:
+            rows, self._reading_buffer = self._reading_buffer, []
+            self._last_reading_flush = time.monotonic()
+        self._write(_READING_INSERT, pack_readings(rows) if rows else [], "log_power", wait=wait)
 
     def prune_old_readings(self, hours=48):
-        try:
-            with self._get_conn() as conn:
-                conn.execute("DELETE FROM power_readings WHERE timestamp < datetime('now', 'localtime', ?)", (f"-{hours} hours",))
-                conn.commit()
-        except Exception as e:
-            print(f"DB Error prune_readings: {e}")
+        # Chunks starting up to an hour before the cutoff may still hold newer samples
+        self._write("DELETE FROM power_readings_blob WHERE start_ts < ?",
+                    [(int(time.time()) - (hours + 1) * 3600,)], "prune_readings")
 
     def get_power_history(self, hours=48):
+        self.flush_power_readings(wait=True)
+        cutoff = int(time.time()) - hours * 3600
         try:
-            with self._get_conn() as conn:
-                cur = conn.execute("SELECT timestamp, power FROM power_readings WHERE timestamp > datetime('now', 'localtime', ?) ORDER BY timestamp ASC", (f"-{hours} hours",))
-                return cur.fetchall()
+            # A row covers one clock hour
+            cur = self._get_conn().execute("SELECT start_ts, samples FROM power_readings_blob WHERE start_ts > ? ORDER BY start_ts ASC", (cutoff - 3600,))
+            history = []
+            for start_ts, blob in cur:
+                secs, powers = unpack_readings(start_ts, blob)
+                keep = secs > cutoff
+                history.extend(zip(secs[keep].tolist(), np.round(powers[keep], 1).tolist()))
+            return history
         except Exception as e:
             print(f"DB Error get_power_history: {e}")
             return []
@@ -260,17 +469,19 @@ class CycleLoader:
             return []
 
     @staticmethod
-    def get_random_template(templates: list[dict], profile_filter: str = None) -> dict | None:
+    def index_templates(templates: list[dict]) -> tuple[list[dict], dict[str, list[dict]]]:
+        """Playable templates, overall and bucketed by profile name."""
         valid = [c for c in templates if c.get("status") == "completed" and c.get("power_data")]
-        if not valid:
-            return None
-        if profile_filter:
-            matches = [c for c in valid if c.get("profile_name") == profile_filter]
-            if matches:
-                return random.choice(matches)
-        return random.choice(valid)
+        by_profile: dict[str, list[dict]] = defaultdict(list)
+        for c in valid:
+            by_profile[c.get("profile_name")].append(c)
+        return valid, dict(by_profile)
 
 class CycleSynthesizer:
+    # Densified template traces, shared by the per-cycle synthesizers
+    _dense_cache: dict[int, tuple[dict, np.ndarray]] = {}
+    _DENSE_CACHE_SIZE = 64
+
     def __init__(self, jitter_w: float = 0.0, variability: float = 0.0, amplitude_scaling: float = 0.0, early_low_prob: float = 0.0):
         self.jitter_w = jitter_w
         self.variability = variability
@@ -287,40 +498,51 @@ class CycleSynthesizer:
         if self.amplitude_scaling > 0:
             amp_factor = random.uniform(1.0 - self.amplitude_scaling, 1.0 + self.amplitude_scaling)
 
-        max_time = int(source_data[-1][0])
-        dense = [0.0] * (max_time + 1)
-        curr_p, idx = 0.0, 0
-        for t in range(max_time + 1):
-            while idx < len(source_data) and source_data[idx][0] <= t:
-                curr_p = float(source_data[idx][1]) * amp_factor
-                idx += 1
-            dense[t] = curr_p
+        dense = self._build_dense(template) * amp_factor
         
         num_seg = 5
         seg_len = max(1, len(dense) // num_seg)
-        warped = []
+        parts = []
         for i in range(num_seg):
             factor = random.uniform(1.0 - self.variability, 1.0 + self.variability)
             s_idx = i * seg_len
             e_idx = min((i + 1) * seg_len, len(dense))
             steps = max(1, int((e_idx - s_idx) * factor))
-            for s in range(steps):
-                rel = s / steps
-                src_i = s_idx + int(rel * (e_idx - s_idx))
-                warped.append(dense[min(src_i, len(dense) - 1)])
+            rel = np.arange(steps) / steps
+            parts.append(s_idx + (rel * (e_idx - s_idx)).astype(np.int64))
         
         if num_seg * seg_len < len(dense):
-            warped.extend(dense[num_seg * seg_len:])
+            parts.append(np.arange(num_seg * seg_len, len(dense)))
+        warped = dense[np.minimum(np.concatenate(parts), len(dense) - 1)]
         
         # Apply early low value if triggered
         if self.early_low_prob > 0 and random.random() < self.early_low_prob:
             # Drop to zero in the last 2-5% of the cycle
             drop_ratio = random.uniform(0.02, 0.05)
             drop_idx = int(len(warped) * (1.0 - drop_ratio))
-            for j in range(drop_idx, len(warped)):
-                warped[j] = 0.0
-
-        return [max(0.0, p + random.normalvariate(0, self.jitter_w) if self.jitter_w > 0 else p) for p in warped]
+            warped[drop_idx:] = 0.0
+
+        if self.jitter_w > 0:
+            warped = np.maximum(warped + np.random.normal(0.0, self.jitter_w, size=warped.shape), 0.0)
+        return warped.tolist()
+
+    @classmethod
+    def _build_dense(cls, template: dict) -> np.ndarray:
+        """Template trace at 1 Hz, each reading held until the next one."""
+        cached = cls._dense_cache.get(id(template))
+        if cached is not None and cached[0] is template:
+            return cached[1]
+        source_data = template["power_data"]
+        times = np.array([float(pt[0]) for pt in source_data])
+        powers = np.array([float(pt[1]) for pt in source_data])
+        max_time = int(source_data[-1][0])
+        src_idx = np.searchsorted(times, np.arange(max_time + 1), side="right") - 1
+        dense = np.where(src_idx >= 0, powers[np.maximum(src_idx, 0)], 0.0)
+        dense.setflags(write=False)
+        if len(cls._dense_cache) >= cls._DENSE_CACHE_SIZE:
+            cls._dense_cache.clear()
+        cls._dense_cache[id(template)] = (template, dense)
+        return dense
 
 # --- Manager ---
 class MockWasherManager:
@@ -331,7 +553,12 @@ class MockWasherManager:
         self.is_paused = False
         self.current_power = 0.0
         self.start_time = 0.0
+        import paho.mqtt.client as mqtt
+        self._mqtt = mqtt
         self.client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2)
+        # Send each small PUBLISH immediately instead of waiting on Nagle
+        self.tcp_nodelay = True
+        self.client.on_socket_open = self._on_mqtt_socket_open
         
         self.config_data = self.db.load_setting("config", {})
         
@@ -360,14 +587,23 @@ class MockWasherManager:
         level = logging.DEBUG if self.state.get("debug_mode") else logging.INFO
         logger.setLevel(level)
 
-        self.session_history = self.db.get_recent_history()
+        # Newest first, keyed by history id
+        self.session_history: OrderedDict[int, dict] = self._load_session_history()
         self.history_version = 0 
         
         self.cycle_thread: threading.Thread | None = None
         self.stop_event = threading.Event()
         self.templates: list[dict] = []
+        self._valid_templates: list[dict] = []
+        self._templates_by_profile: dict[str, list[dict]] = {}
+        self._templates_by_id: dict[str, dict] = {}
         self._seq_idx = 0
-        self.current_readings_buffer = []
+        # Parsed cycle_sequence, re-split only when the bound text changes
+        self._seq_source: str | None = None
+        self._seq_cache: list[str] = []
+        # (hours, monotonic fetch time, rows) behind recent_power_history
+        self._power_history_cache: tuple[int, float, list] | None = None
+        self.current_readings_buffer: deque[list] = deque(maxlen=MAX_SAMPLES_PER_CYCLE)
         self.current_profile_name = None
         self.current_total_duration = 0.0
         self._next_template_id = None
@@ -384,6 +620,7 @@ class MockWasherManager:
         level = logging.DEBUG if self.state.get("debug_mode") else logging.INFO
         logger.setLevel(level)
         mode_str = "DEBUG" if level == logging.DEBUG else "INFO"
+        from nicegui import ui
         ui.notify(f"Config Saved. Logs: {mode_str}")
 
     def connect_mqtt(self):
@@ -400,13 +637,19 @@ class MockWasherManager:
             logger.error("MQTT Connection Failed: %s", e)
 
     def _publish_discovery(self):
-        device = {"identifiers": [DEVICE_ID], "name": DEVICE_NAME, "manufacturer": "HA WashData", "model": "Mock Socket"}
-        sensor_cfg = {"name": "Mock Washer Power", "state_topic": SENSOR_STATE_TOPIC, "availability_topic": AVAIL_TOPIC, "unit_of_measurement": "W", "device_class": "power", "state_class": "measurement", "unique_id": f"{DEVICE_ID}_power", "device": device}
-        switch_cfg = {"name": "Mock Washer Start", "command_topic": COMMAND_TOPIC, "state_topic": STATE_TOPIC, "availability_topic": AVAIL_TOPIC, "payload_on": "ON", "payload_off": "OFF", "unique_id": f"{DEVICE_ID}_switch", "device": device}
-        self.client.publish(SENSOR_CONFIG_TOPIC, json.dumps(sensor_cfg), retain=True)
-        self.client.publish(SWITCH_CONFIG_TOPIC, json.dumps(switch_cfg), retain=True)
+        self.client.publish(SENSOR_CONFIG_TOPIC, DISCOVERY_SENSOR_PAYLOAD, retain=True)
+        self.client.publish(SWITCH_CONFIG_TOPIC, DISCOVERY_SWITCH_PAYLOAD, retain=True)
         self.client.publish(AVAIL_TOPIC, "online", retain=True)
 
+    def _on_mqtt_socket_open(self, client, userdata, sock):
+        # Runs for every (re)connect, so reconnects keep the option
+        if not self.tcp_nodelay:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except (OSError, AttributeError):
+            pass  # Not a TCP socket (e.g. websockets or a UNIX socket)
+
     def _on_mqtt_message(self, client, userdata, msg):
         payload = msg.payload.decode()
         logger.info("MQTT Command: %s", payload)
@@ -418,12 +661,29 @@ class MockWasherManager:
     def load_templates(self, filepath: str) -> int:
         self.state["cycle_source_file"] = filepath # Ensure state reflects loaded file
         self.templates = CycleLoader.load_from_file(filepath)
+        self._valid_templates, self._templates_by_profile = CycleLoader.index_templates(self.templates)
+        self._templates_by_id = {t["id"]: t for t in self.templates if t.get("id")}
         count = len(self.templates)
         valid = len([t for t in self.templates if t.get("power_data")])
         logger.info("Loaded %d templates (%d with power data) from %s", count, valid, filepath)
         # We don't save config here to avoid spamming saves if auto-loading, but UI triggers save on upload
         return valid
 
+    def cycle_sequence(self) -> list[str]:
+        source = self.state["cycle_sequence"]
+        if source != self._seq_source:
+            self._seq_source = source
+            self._seq_cache = [s.strip() for s in source.split(",") if s.strip()]
+        return self._seq_cache
+
+    def recent_power_history(self, hours: int = 48, ttl: float = 5.0) -> list[tuple[int, float]]:
+        """Chart bootstrap rows, shared by page loads within ttl seconds."""
+        cached = self._power_history_cache
+        if cached is None or cached[0] != hours or time.monotonic() - cached[1] > ttl:
+            cached = (hours, time.monotonic(), self.db.get_power_history(hours))
+            self._power_history_cache = cached
+        return cached[2]
+
     def _pick_next_template(self) -> dict | None:
         if not self.templates:
             # Try to auto-load if configured and not loaded
@@ -436,42 +696,53 @@ class MockWasherManager:
         
         # Priority 1: Manual Override
         if self._next_template_id:
-            template = next((t for t in self.templates if t.get("id") == self._next_template_id), None)
+            template = self._templates_by_id.get(self._next_template_id)
             self._next_template_id = None # Clear after picking
             if template:
                 return template
 
         # Priority 2: Sequence
-        seq = [s.strip() for s in self.state["cycle_sequence"].split(",") if s.strip()]
+        seq = self.cycle_sequence()
         target = seq[self._seq_idx % len(seq)] if seq else None
         self._seq_idx += 1
         
-        template = CycleLoader.get_random_template(self.templates, target)
-        if not template and target:
+        pool = self._templates_by_profile.get(target) if target else None
+        if target and not pool:
             logger.warning("No template matched '%s', using random.", target)
-            template = CycleLoader.get_random_template(self.templates)
-        
-        return template
+        pool = pool or self._valid_templates
+        return random.choice(pool) if pool else None
     
     def _add_history(self, profile_name, duration_sec, status, readings, settings):
-        # We re-fetch from DB to get IDs, slightly inefficient but simple
         entry = {
             "time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "profile": profile_name,
             "duration": f"{duration_sec:.1f}s",
             "duration_val": duration_sec,
             "status": status,
-            "settings": copy.deepcopy(settings),
-            "readings": copy.deepcopy(readings)
+            # Settings stay live in the UI; readings buffer is replaced per cycle
+            "settings": dict(settings),
+            "readings": readings
         }
-        self.db.add_history(entry)
-        # Refresh full history from DB to ensure IDs are correct
-        self.session_history = self.db.get_recent_history()
+        entry_id = self.db.add_history(entry)
+        if entry_id is None:
+            # Insert failed; show what the database actually holds
+            self.session_history = self._load_session_history()
+        else:
+            entry["id"] = entry_id
+            # Rebound, never mutated: the UI may be iterating the old one
+            history = OrderedDict([(entry_id, entry)])
+            history.update(islice(self.session_history.items(), HISTORY_LIMIT - 1))
+            self.session_history = history
         self.history_version += 1
 
+    def _load_session_history(self) -> OrderedDict[int, dict]:
+        return OrderedDict((e["id"], e) for e in self.db.get_recent_history_summary())
+
     def delete_history_items(self, ids: list[int]):
         self.db.delete_history_items(ids)
-        self.session_history = self.db.get_recent_history()
+        removed = set(ids)
+        self.session_history = OrderedDict(
+            (eid, e) for eid, e in self.session_history.items() if eid not in removed)
         self.history_version += 1
 
     def start_cycle(self):
@@ -481,8 +752,8 @@ class MockWasherManager:
             logger.error("Cannot start: No templates loaded!")
             return
         
-        # Prune old data on start
-        threading.Thread(target=self.db.prune_old_readings, args=(48,), daemon=True).start()
+        # Prune old data on start (queued on the DB writer thread)
+        self.db.prune_old_readings(48)
         
         self.stop_event.clear()
         self.is_running = True
@@ -496,6 +767,7 @@ class MockWasherManager:
         self.stop_event.set()
         if self.cycle_thread:
             self.cycle_thread.join(timeout=1.0)
+        self.db.flush_power_readings()
         self.is_running = False
         self.is_paused = False
         self.current_power = 0.0
@@ -535,7 +807,7 @@ class MockWasherManager:
                 logger.error("Synthesis produced no readings. Skipping.")
                 continue
             
-            self.current_readings_buffer = []
+            self.current_readings_buffer = deque(maxlen=MAX_SAMPLES_PER_CYCLE)
             self.start_time = time.time()
             start_wall_time = self.start_time
             cycle_status = "Completed"
@@ -550,9 +822,14 @@ class MockWasherManager:
             self.current_total_duration = total_duration
             logger.info("Playing %d samples (~%.1fs wall time, profile: %s)", len(readings), total_duration, profile_name)
             
-            start_ts = time.time()
-            i = 0
-            while i < len(readings):
+            # Only every step-th reading is played; format those payloads
+            # before the timed loop starts
+            played = readings[::step]
+            payloads = [format(p, ".1f") for p in played]
+            
+            # Monotonic deadlines: immune to wall-clock (NTP) jumps
+            deadline = time.monotonic()
+            for p, payload in zip(played, payloads):
                 if self.stop_event.is_set():
                     cycle_status = "Stopped"
                     break
@@ -560,15 +837,15 @@ class MockWasherManager:
                 while self.is_paused and not self.stop_event.is_set():
                     time.sleep(0.1)
                 
-                p = readings[i]
                 self.current_power = p
-                self.client.publish(SENSOR_STATE_TOPIC, f"{p:.1f}")
+                self.client.publish(SENSOR_STATE_TOPIC, payload)
                 
                 # Log to DB
-                self.db.log_power_reading(p)
+                now = time.time()
+                ts = now_timestamp(now)
+                self.db.log_power_reading(p, now)
                 
-                now_str = datetime.now().strftime("%H:%M:%S")
-                self.current_readings_buffer.append([now_str, p])
+                self.current_readings_buffer.append([ts[11:], p])
                 
                 if self.state["debug_mode"]:
                     logger.debug("PUB: %s -> %.1f W", SENSOR_STATE_TOPIC, p)
@@ -579,18 +856,21 @@ class MockWasherManager:
                     jitter_max = self.state.get("timing_jitter_amount", 0.5) / speedup
                     jitter_off = random.uniform(-jitter_max, jitter_max)
 
-                target = start_ts + ((i / step + 1) * sleep_time) + jitter_off
-                rem = target - time.time()
+                deadline += sleep_time
+                rem = deadline + jitter_off - time.monotonic()
                 if rem > 0:
                     time.sleep(rem)
-                
-                i += step
+                else:
+                    # Fell behind (pause, slow publish): resync rather than
+                    # bursting the missed samples out back to back
+                    deadline = time.monotonic()
             
             self.client.publish(SENSOR_STATE_TOPIC, "0")
             if self.state["debug_mode"]:
                 logger.debug("PUB: %s -> 0.0 W", SENSOR_STATE_TOPIC)
             
             self.current_power = 0.0
+            self.db.flush_power_readings()
             
             actual_duration = time.time() - start_wall_time
             logger.info("Cycle %s: %s (took %.1fs)", cycle_status, profile_name, actual_duration)
@@ -599,7 +879,7 @@ class MockWasherManager:
                 profile_name, 
                 actual_duration, 
                 cycle_status, 
-                self.current_readings_buffer,
+                list(self.current_readings_buffer),
                 self.state 
             )
             
@@ -617,9 +897,7 @@ class MockWasherManager:
         self.is_running = False
         self.client.publish(STATE_TOPIC, "OFF")
 
-manager = MockWasherManager()
-# Attach log handler with DB support
-logger.addHandler(NiceGUIHandler(manager.db))
+manager: MockWasherManager  # Created by the __main__ block below
 
 def parse_args():
     parser = argparse.ArgumentParser(description="MQTT Mock Washer - Synthesis Mode")
@@ -629,11 +907,107 @@ def parse_args():
     parser.add_argument("--host", default=None, help=argparse.SUPPRESS) 
     parser.add_argument("--port", type=int, default=None, help=argparse.SUPPRESS)
     parser.add_argument("--cycle-source", default=None, help="Path to cycle data JSON")
+    parser.add_argument("--nodelay", action=argparse.BooleanOptionalAction, default=True, help="Disable Nagle on the MQTT socket (Default: on)")
+    parser.add_argument("--no-uvloop", action="store_true", help="Serve on the stock asyncio loop (e.g. for profiling)")
     return parser.parse_known_args()[0]
 
 # --- UI ---
-@ui.page('/')
+class PowerWindow:
+    """Sliding window of (epoch, power) samples behind the live chart."""
+
+    def __init__(self, rows: list[tuple[float, float]], min_len: int = 500):
+        # Like the old list that popped one item per append: never shrinks
+        self.maxlen = max(min_len, len(rows))
+        # Rows: epoch seconds, watts. Twice the window so appends only
+        # compact once per maxlen samples.
+        self._buf = np.empty((2, 2 * self.maxlen), dtype=np.float64)
+        if rows:
+            self._buf[:, :len(rows)] = np.asarray(rows, dtype=np.float64).T
+        self._start, self._end = 0, len(rows)
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def times(self) -> np.ndarray:
+        return self._buf[0, self._start:self._end]
+
+    @property
+    def powers(self) -> np.ndarray:
+        return self._buf[1, self._start:self._end]
+
+    def points(self) -> list[list[float]]:
+        """[epoch_ms, watts] pairs for a time-axis chart series."""
+        return (self._buf[:, self._start:self._end].T * (1000.0, 1.0)).tolist()
+
+    def append(self, ts: float, power: float):
+        if self._end == self._buf.shape[1]:
+            n = len(self)
+            self._buf[:, :n] = self._buf[:, self._start:self._end]
+            self._start, self._end = 0, n
+        self._buf[:, self._end] = (ts, power)
+        self._end += 1
+        if len(self) > self.maxlen:
+            self._start += 1
+
+# Live chart layout shared by every page; only the series data is per page
+LIVE_CHART_OPTIONS = {
+    'grid': {'top': 30, 'bottom': 40, 'left': 40, 'right': 20, 'containLabel': True},
+    'tooltip': {'trigger': 'axis', 'position': "top"},
+    'toolbox': {
+        'feature': {
+            'dataZoom': {'yAxisIndex': 'none'},
+            'brush': {'type': ['lineX', 'clear']},
+            'restore': {}
+        }
+    },
+    'brush': {'xAxisIndex': 'all'},
+    'dataZoom': [{'type': 'inside', 'start': 98, 'end': 100}, {'type': 'slider', 'start': 98, 'end': 100}],
+    'xAxis': {'type': 'time'},
+    'yAxis': {'type': 'value'},
+    'series': [{'type': 'line', 'data': [], 'smooth': False, 'showSymbol': False, 'areaStyle': {'opacity': 0.2}}]
+}
+
+def json_loads(payload: str):
+    return orjson.loads(payload) if orjson is not None else json.loads(payload)
+
+def selection_stats(history: PowerWindow, coord_range: list) -> dict | None:
+    """Measure-card statistics for a brushed chart range in epoch ms."""
+    times = history.times
+    start_idx = int(np.searchsorted(times, coord_range[0] / 1000.0, side="left"))
+    end_idx = int(np.searchsorted(times, coord_range[1] / 1000.0, side="right")) - 1
+
+    window = history.powers[start_idx:end_idx+1]
+    if not len(window):
+        return None
+
+    duration = float(times[end_idx] - times[start_idx])
+
+    avg_p = float(window.mean())
+    return {
+        "start": format_timestamp(int(times[start_idx])),
+        "end": format_timestamp(int(times[end_idx])),
+        "duration": duration,
+        "peak": float(window.max()),
+        "avg": avg_p,
+        "std": float(window.std()),
+        "energy_wh": avg_p * (duration / 3600.0),
+    }
+
+def downsample(pairs: list, target: int = 500) -> list:
+    """Every n-th (timestamp, power) pair so at most ~target are charted."""
+    if len(pairs) <= target:
+        return pairs
+    step = -(-len(pairs) // target)
+    thinned = pairs[::step]
+    # Keep the cycle's final reading so the chart ends where the cycle did
+    if (len(pairs) - 1) % step:
+        thinned.append(pairs[-1])
+    return thinned
+
 def main_page():
+    from nicegui import ui, events
+
     # Header log
     with ui.expansion("Logs", icon="list", value=True).classes('w-full bg-slate-100 mb-2'):
         with ui.scroll_area().classes('w-full h-48 bg-slate-900 text-green-400 font-mono text-xs p-2 rounded') as log_scroll:
@@ -759,6 +1133,7 @@ def main_page():
 
                     async def handle_upload(e: events.UploadEventArguments):
                         try:
+                            os.makedirs(UPLOAD_DIR, exist_ok=True)
                             fpath = os.path.join(UPLOAD_DIR, e.file.name)
                             content = await e.file.read()
                             with open(fpath, 'wb') as f:
@@ -788,7 +1163,7 @@ def main_page():
                                 return
                             
                             # Next Up Info
-                            seq = [s.strip() for s in manager.state["cycle_sequence"].split(",") if s.strip()]
+                            seq = manager.cycle_sequence()
                             target_next = seq[manager._seq_idx % len(seq)] if seq else None
                             
                             for t in manager.templates:
@@ -906,24 +1281,12 @@ def main_page():
                             lbl_energy.classes('font-bold')
 
                 # Initial History Load
-                raw_history = manager.db.get_power_history(48)
-                power_history = [(r[0], r[1]) for r in raw_history]
+                raw_history = manager.recent_power_history(48)
+                power_history = PowerWindow(raw_history)
 
                 updated_opts = {
-                    'grid': {'top': 30, 'bottom': 40, 'left': 40, 'right': 20, 'containLabel': True},
-                    'tooltip': {'trigger': 'axis', 'position': "top"},
-                    'toolbox': {
-                        'feature': {
-                            'dataZoom': {'yAxisIndex': 'none'}, 
-                            'brush': {'type': ['lineX', 'clear']},
-                            'restore': {}
-                        }
-                    },
-                    'brush': {'xAxisIndex': 'all'},
-                    'dataZoom': [{'type': 'inside', 'start': 98, 'end': 100}, {'type': 'slider', 'start': 98, 'end': 100}],
-                    'xAxis': {'type': 'category', 'data': [x[0] for x in power_history]},
-                    'yAxis': {'type': 'value'},
-                    'series': [{'type': 'line', 'data': [x[1] for x in power_history], 'smooth': False, 'showSymbol': False, 'areaStyle': {'opacity': 0.2}}] 
+                    **LIVE_CHART_OPTIONS,
+                    'series': [{**LIVE_CHART_OPTIONS['series'][0], 'data': power_history.points()}],
                 }
                 chart = ui.echart(updated_opts).classes('flex-grow h-80')
             
@@ -945,7 +1308,24 @@ def main_page():
             chart.on('brushEnd', js_handler)
             chart.on('brushSelected', js_handler)
 
+            # Single-flight: a brush during a poll re-runs it once afterwards
+            poll_state = {'in_flight': False, 'rerun': False}
+
             async def update_stats_js():
+                if poll_state['in_flight']:
+                    poll_state['rerun'] = True
+                    return
+                poll_state['in_flight'] = True
+                try:
+                    while True:
+                        poll_state['rerun'] = False
+                        await poll_selection_stats()
+                        if not poll_state['rerun']:
+                            break
+                finally:
+                    poll_state['in_flight'] = False
+
+            async def poll_selection_stats():
                 try:
                     # Read the variable
                     result = await ui.run_javascript(f"return {debug_var};", timeout=2.0)
@@ -953,7 +1333,11 @@ def main_page():
                     if not result or result == 'NO_EVENT_YET':
                         return
                         
-                    params = json.loads(result)
+                    # batch brushSelected events can carry whole series
+                    if len(result) > 4096:
+                        params = await asyncio.to_thread(json_loads, result)
+                    else:
+                        params = json_loads(result)
                     areas = []
                     
                     if 'areas' in params:
@@ -968,52 +1352,18 @@ def main_page():
                     if not coord_range or len(coord_range) < 2:
                          return
                          
-                    # --- SUCCESS PATH ---
-                    start_idx = int(max(0, round(coord_range[0])))
-                    end_idx = int(min(len(power_history) - 1, round(coord_range[1])))
-
-                    selection = power_history[start_idx:end_idx+1]
-                    if not selection: 
+                    stats = selection_stats(power_history, coord_range)
+                    if stats is None:
                         return
 
-                    t_start_str = selection[0][0]
-                    t_end_str = selection[-1][0]
-                    
-                    # Parse timestamps
-                    fmt = "%Y-%m-%d %H:%M:%S"
-                    fmt_short = "%H:%M:%S"
-                    try:
-                        t_start = datetime.strptime(t_start_str, fmt)
-                        t_end = datetime.strptime(t_end_str, fmt)
-                        duration = (t_end - t_start).total_seconds()
-                    except ValueError:
-                        try:
-                            # Use current date if short format
-                            today = datetime.now().date()
-                            t_start = datetime.combine(today, datetime.strptime(t_start_str, fmt_short).time())
-                            t_end = datetime.combine(today, datetime.strptime(t_end_str, fmt_short).time())
-                            duration = (t_end - t_start).total_seconds()
-                        except Exception:
-                            duration = 0
-
-                    powers = [p[1] for p in selection]
-                    if not powers: return
-                        
-                    peak_p = max(powers)
-                    avg_p = sum(powers) / len(powers)
-                    energy_wh = avg_p * (duration / 3600.0)
-                    
-                    variance = sum((p - avg_p)**2 for p in powers) / len(powers)
-                    std_dev = math.sqrt(variance)
-
                     # Update UI
-                    lbl_start.text = t_start_str
-                    lbl_end.text = t_end_str
-                    lbl_dur.text = f"{duration:.1f}s"
-                    lbl_peak.text = f"{peak_p:.1f} W"
-                    lbl_avg.text = f"{avg_p:.1f} W"
-                    lbl_var.text = f"{std_dev:.2f} W"
-                    lbl_energy.text = f"{energy_wh:.4f} Wh"
+                    lbl_start.text = stats["start"]
+                    lbl_end.text = stats["end"]
+                    lbl_dur.text = f"{stats['duration']:.1f}s"
+                    lbl_peak.text = f"{stats['peak']:.1f} W"
+                    lbl_avg.text = f"{stats['avg']:.1f} W"
+                    lbl_var.text = f"{stats['std']:.2f} W"
+                    lbl_energy.text = f"{stats['energy_wh']:.4f} Wh"
                     
                     instr_label.classes(add='hidden')
                     stats_container.classes(remove='hidden')
@@ -1028,7 +1378,8 @@ def main_page():
             # Try to trigger on brushEnd anyway (no args needed)
             # chart.on('brushEnd', update_stats_js) # Might cause recursion/lag if blocking
             # Let's rely on manual refresh mainly, or lightweight trigger
-            chart.on('brushEnd', lambda e: update_stats_js())
+            # Throttled: dragging a brush emits brushEnd in bursts
+            chart.on('brushEnd', lambda e: update_stats_js(), throttle=0.15)
             
             # Debug click
             def on_chart_click(e):
@@ -1040,13 +1391,13 @@ def main_page():
                 with ui.row().classes('w-full items-center justify-between mb-2'):
                     ui.label("Session History (From Database)").classes('text-lg font-bold')
                     
-                    selected_ids = []
+                    selected_ids: set = set()
                     
                     def delete_selected():
                         if not selected_ids:
                             ui.notify("No items selected")
                             return
-                        manager.delete_history_items(selected_ids)
+                        manager.delete_history_items(list(selected_ids))
                         selected_ids.clear()
                         ui.notify("Deleted selected items")
 
@@ -1054,59 +1405,99 @@ def main_page():
                 
                 history_container = ui.column().classes('w-full gap-2')
             
-            ui_state = {'last_history_version': -1}
+            ui_state = {'last_history_version': -1, 'status': None}
             
+            rendered_details: set = set()
+            # History id -> row element; rows are diffed, not rebuilt
+            rendered_rows: dict = {}
+            with history_container:
+                empty_lbl = ui.label("No history found.").classes('text-gray-500 italic')
+
             def refresh_history():
-                history_container.clear()
-                selected_ids.clear() # Reset selection on refresh to avoid outdated IDs
+                history = manager.session_history
+                for entry_id in rendered_rows.keys() - history.keys():
+                    history_container.remove(rendered_rows.pop(entry_id))
+                    rendered_details.discard(entry_id)
+                    selected_ids.discard(entry_id)
+
+                # Existing rows keep their relative order; slot new ones in
+                for index, (entry_id, entry) in enumerate(history.items()):
+                    if entry_id not in rendered_rows:
+                        row = build_history_row(entry)
+                        row.move(target_index=index + 1)  # after empty_lbl
+                        rendered_rows[entry_id] = row
+                empty_lbl.set_visibility(not rendered_rows)
+
+            def build_history_row(entry):
+                entry_id = entry.get('id')
                 with history_container:
-                    if not manager.session_history:
-                        ui.label("No history found.").classes('text-gray-500 italic')
-                        return
-
-                    for entry in manager.session_history:
-                        entry_id = entry.get('id')
-                        with ui.row().classes('w-full items-start gap-2'):
-                            # Checkbox for selection
-                            chk = ui.checkbox(on_change=lambda e, eid=entry_id: selected_ids.append(eid) if e.value else selected_ids.remove(eid))
-                            
-                            # Expansion content
-                            with ui.expansion(f"{entry['time']} - {entry['profile']} ({entry['duration']})", caption=entry['status']).classes('flex-grow border rounded bg-white'):
-                                with ui.row().classes('gap-4 text-sm text-gray-600 mb-2'):
-                                    ui.label(f"Speedup: {entry['settings']['speedup']}x")
-                                    ui.label(f"Jitter: {entry['settings']['jitter']}W")
-                                    ui.label(f"Variability: {entry['settings']['variability']}")
-                                    ui.label(f"Interval: {entry['settings']['update_interval']}s")
-                                
-                                ui.echart({
-                                    'grid': {'left': 30, 'right': 10, 'top': 30, 'bottom': 30},
-                                    'tooltip': {'trigger': 'axis'},
-                                    'xAxis': {'type': 'category', 'data': [r[0] for r in entry['readings']]},
-                                    'yAxis': {'type': 'value'},
-                                    'series': [{'type': 'line', 'data': [r[1] for r in entry['readings']], 'smooth': True, 'showSymbol': False}]
-                                }).classes('w-full h-40')
+                    with ui.row().classes('w-full items-start gap-2') as row:
+                        # Checkbox for selection
+                        chk = ui.checkbox(on_change=lambda e, eid=entry_id: selected_ids.add(eid) if e.value else selected_ids.discard(eid))
+                        
+                        # Expansion content, built on first open
+                        with ui.expansion(f"{entry['time']} - {entry['profile']} ({entry['duration']})", caption=entry['status']).classes('flex-grow border rounded bg-white') as entry_exp:
+                            detail_box = ui.column().classes('w-full gap-0')
+                        entry_exp.on('show', lambda _, entry=entry, box=detail_box: show_history_detail(entry, box))
+                return row
+
+            def show_history_detail(entry, box):
+                if entry.get('id') in rendered_details:
+                    return
+                if 'readings' not in entry:
+                    # Summary rows carry no blobs; decode this one on demand
+                    entry.update(manager.db.get_history_detail(entry['id']) or {'settings': {}, 'readings': []})
+                rendered_details.add(entry.get('id'))
+                settings = entry['settings']
+                readings = downsample(entry['readings'])
+                with box:
+                    with ui.row().classes('gap-4 text-sm text-gray-600 mb-2'):
+                        ui.label(f"Speedup: {settings.get('speedup')}x")
+                        ui.label(f"Jitter: {settings.get('jitter')}W")
+                        ui.label(f"Variability: {settings.get('variability')}")
+                        ui.label(f"Interval: {settings.get('update_interval')}s")
+                    
+                    ui.echart({
+                        'grid': {'left': 30, 'right': 10, 'top': 30, 'bottom': 30},
+                        'tooltip': {'trigger': 'axis'},
+                        'xAxis': {'type': 'category', 'data': [r[0] for r in readings]},
+                        'yAxis': {'type': 'value'},
+                        'series': [{'type': 'line', 'data': [r[1] for r in readings], 'smooth': True, 'showSymbol': False}]
+                    }).classes('w-full h-40')
 
 
             async def update_ui():
                 await check_logs()
-                if manager.is_running:
-                    if manager.is_paused:
+                # Chip, buttons and idle labels only change with the status;
+                # classes()/props() push an update even when nothing differs
+                if not manager.is_running:
+                    status = "STOPPED"
+                else:
+                    status = "PAUSED" if manager.is_paused else "RUNNING"
+                if ui_state['status'] != status:
+                    ui_state['status'] = status
+                    if status == "PAUSED":
                         status_chip.text = "PAUSED"
                         status_chip.classes(replace='bg-yellow-500', remove='bg-red-500 bg-green-500')
                         btn_pause.text = "RESUME"
-                    else:
+                    elif status == "RUNNING":
                         status_chip.text = "RUNNING"
                         status_chip.classes(replace='bg-green-500', remove='bg-red-500 bg-yellow-500')
                         btn_pause.text = "PAUSE"
-                    btn_start.text = "STOP"
-                    btn_start.props('color=red')
-                    btn_pause.set_visibility(True)
-                else:
-                    status_chip.text = "STOPPED"
-                    status_chip.classes(replace='bg-red-500', remove='bg-green-500 bg-yellow-500')
-                    btn_start.text = "START"
-                    btn_start.props('color=green')
-                    btn_pause.set_visibility(False)
+                    if status != "STOPPED":
+                        btn_start.text = "STOP"
+                        btn_start.props('color=red')
+                        btn_pause.set_visibility(True)
+                    else:
+                        status_chip.text = "STOPPED"
+                        status_chip.classes(replace='bg-red-500', remove='bg-green-500 bg-yellow-500')
+                        btn_start.text = "START"
+                        btn_start.props('color=green')
+                        btn_pause.set_visibility(False)
+                        time_lbl.set_text("00:00")
+                        remaining_lbl.set_text("")
+                        start_lbl.set_text("Start: --:--:--")
+                        cycle_name_lbl.set_text("Cycle: --")
                 
                 if manager.is_running:
                     p = manager.current_power
@@ -1127,48 +1518,51 @@ def main_page():
                     if manager.current_profile_name:
                         cycle_name_lbl.set_text(f"Cycle: {manager.current_profile_name}")
                     
-                    now_str = datetime.now().strftime("%H:%M:%S")
-                    power_history.append((now_str, p))
-                    if len(power_history) > 500:
-                        power_history.pop(0)
+                    power_history.append(time.time(), p)
                     
                     # Update chart data without resetting zoom/pan state
-                    # Use run_chart_method to call setOption with only the data changes
-                    new_x_data = [x[0] for x in power_history]
-                    new_y_data = [x[1] for x in power_history]
+                    # Use run_chart_method to call setOption with only the data changes;
+                    # the time axis derives its ticks from the points themselves
                     chart.run_chart_method(
                         'setOption',
                         {
-                            'xAxis': {'data': new_x_data},
-                            'series': [{'data': new_y_data}]
+                            'series': [{'data': power_history.points()}]
                         },
                         False  # notMerge=False (merge mode, preserves existing options like dataZoom)
                     )
-                else:
-                    time_lbl.set_text("00:00")
-                    remaining_lbl.set_text("")
-                    start_lbl.set_text("Start: --:--:--")
-                    cycle_name_lbl.set_text("Cycle: --")
                 
                 if ui_state['last_history_version'] != manager.history_version:
                     refresh_history()
                     ui_state['last_history_version'] = manager.history_version
 
-            ui.timer(0.5, update_ui)
+                # Idle pages only need to notice logs, history and a start
+                ui_timer.interval = 0.5 if manager.is_running else 2.0
+
+            ui_timer = ui.timer(0.5, update_ui)
             log_box
 
     # Auto-load templates if configured and not already loaded (prevents log spam)
     if manager.state.get("cycle_source_file") and not manager.templates:
         ui.timer(0.5, lambda: manager.load_templates(manager.state["cycle_source_file"]), once=True)
 
-# Connect on startup (outside page scope)
-# Connect on startup (outside page scope)
-from nicegui import app
-
 if __name__ in {"__main__", "__mp_main__"}:
+    args = parse_args()
+
+    from nicegui import app, ui
+
+    manager = MockWasherManager()
+    # Attach log handler with DB support; records are formatted and stored
+    # on the listener thread so logging never stalls the cycle loop
+    log_queue = queue.SimpleQueue()
+    log_listener = QueueListener(log_queue, NiceGUIHandler(manager.db))
+    log_listener.start()
+    atexit.register(log_listener.stop)
+    logger.addHandler(QueueHandler(log_queue))
+    ui.page('/')(main_page)
+
+    # Connect on startup (outside page scope)
     app.on_startup(manager.connect_mqtt)
 
-    args = parse_args()
     # If CLI args are provided, they override DB settings
     if args.mqtt_host:
         manager.mqtt_host = args.mqtt_host
@@ -1183,4 +1577,8 @@ if __name__ in {"__main__", "__mp_main__"}:
     if args.cycle_source:
         manager.state["cycle_source_file"] = args.cycle_source
 
-    ui.run(title="Mock Washer", port=args.web_port, show=False, reload=False)
+    manager.tcp_nodelay = args.nodelay
+
+    # uvicorn runs on uvloop whenever it is installed
+    loop_kwargs = {"loop": "asyncio"} if args.no_uvloop else {}
+    ui.run(title="Mock Washer", port=args.web_port, show=False, reload=False, **loop_kwargs)
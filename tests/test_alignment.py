@@ -6,7 +6,10 @@ from unittest.mock import MagicMock, patch, AsyncMock
 from datetime import datetime, timezone
 
 from custom_components.ha_washdata.profile_store import ProfileStore, MatchResult
-from custom_components.ha_washdata.analysis import find_best_alignment
+from custom_components.ha_washdata.analysis import (
+    compute_matches_worker,
+    find_best_alignment,
+)
 
 # Use a concrete datetime for testing to simplify mocking
 MOCK_NOW = datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
@@ -91,3 +94,51 @@ async def test_match_profile_integration_shifted(store):
     # Match might not be perfect due to test setup, but should find profile
     if result.best_profile:
         assert result.best_profile == "TestProfile"
+
+
+def test_find_best_alignment_flat_series_has_zero_correlation():
+    """Test a constant trace scores on MAE alone without NaN correlation."""
+    flat = np.full(20, 50.0)
+    ramp = np.linspace(0.0, 100.0, 20)
+
+    score, metrics, _ = find_best_alignment(flat, ramp, dt=5.0)
+
+    assert np.isfinite(score)
+    assert abs(metrics["corr"]) < 1e-6
+    assert score == pytest.approx(0.4 * 100.0 / (100.0 + metrics["mae"]))
+
+
+def test_compute_matches_worker_shares_current_prep():
+    """Batch matching scores each sample exactly like a standalone alignment."""
+    rng = np.random.default_rng(7)
+    current = (np.abs(np.sin(np.linspace(0, 12, 450))) * 800).tolist()
+    samples = {
+        "Same": np.asarray(current, dtype=np.float32),
+        "Shifted": np.roll(current, 25).astype(np.float32),
+        "Noise": (rng.random(400) * 900).astype(np.float32),
+    }
+    snapshots = [
+        {"name": n, "avg_duration": 4500.0, "sample_power": p}
+        for n, p in samples.items()
+    ]
+
+    candidates = compute_matches_worker(
+        current, 4500.0, snapshots, {"dtw_bandwidth": 0.0}
+    )
+
+    assert candidates
+    for cand in candidates:
+        score, _, offset = find_best_alignment(current, samples[cand["name"]], 1.0)
+        assert cand["score"] == score
+        assert cand["offset"] == offset
+
+
+def test_find_best_alignment_near_flat_series_has_zero_correlation():
+    """Test sub-noise wiggle on a flat trace does not count as correlation."""
+    ramp = np.linspace(0.0, 100.0, 20)
+    near_flat = 50.0 + 1e-9 * ramp
+
+    score, metrics, _ = find_best_alignment(near_flat, ramp, dt=5.0)
+
+    assert metrics["corr"] == 0.0
+    assert score == pytest.approx(0.4 * 100.0 / (100.0 + metrics["mae"]))
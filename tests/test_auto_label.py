@@ -7,6 +7,7 @@ from custom_components.ha_washdata.profile_store import ProfileStore, MatchResul
 @pytest.fixture
 def mock_hass():
     hass = MagicMock()
+    hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
     return hass
 
 @pytest.fixture
@@ -106,3 +107,29 @@ async def test_auto_label_cycles_no_overwrite(store):
     
     c1 = store._data["past_cycles"][0]
     assert c1["profile_name"] == "WrongProfile"
+
+@pytest.mark.asyncio
+async def test_auto_label_resolves_samples_once(store):
+    """Test profile samples are resolved once per pass, not per cycle."""
+    store._data["profiles"] = {"P": {"sample_cycle_id": "s1"}}
+    store._data["past_cycles"] = [
+        {"id": "s1", "profile_name": "P", "duration": 3600, "power_data": []},
+        {"id": "c1", "profile_name": None, "duration": 3600, "power_data": []},
+        {"id": "c2", "profile_name": None, "duration": 3600, "power_data": []},
+    ]
+
+    no_match = MatchResult(None, 0.0, 0.0, None, [], False, 0.0)
+    with patch.object(store, "async_match_profile", return_value=no_match) as mock_match, \
+         patch.object(store, "_decompress_power_data", return_value=[("t", 1.0)] * 20), \
+         patch.object(
+             store, "_resolve_profile_samples", wraps=store._resolve_profile_samples
+         ) as mock_resolve:
+
+        stats = await store.auto_label_cycles(confidence_threshold=0.8)
+
+        assert stats["skipped"] == 2
+        assert mock_resolve.call_count == 1
+        resolved, skipped = mock_match.call_args_list[0].args[2]
+        assert [name for name, _, _ in resolved] == ["P"]
+        assert skipped == []
+        assert mock_match.call_args_list[1].args[2] is mock_match.call_args_list[0].args[2]
@@ -2,7 +2,7 @@
 
 import pytest
 import numpy as np
-from custom_components.ha_washdata.analysis import compute_dtw_lite
+from custom_components.ha_washdata.analysis import compute_dtw_lite, compute_dtw_path
 
 
 def test_dtw_band_constraint():
@@ -39,3 +39,47 @@ def test_dtw_normalization():
 
     # Total cost = 100 * 1 = 100 (unnormalized)
     assert d == 100.0
+
+
+def _reference_banded_dtw(x, y, band_width_ratio):
+    """Full-matrix banded DTW used as an oracle for the rolling-row version."""
+    n, m = len(x), len(y)
+    w = max(1, int(min(n, m) * band_width_ratio))
+    cost = np.full((n + 1, m + 1), np.inf)
+    cost[0, 0] = 0.0
+    for i in range(1, n + 1):
+        center = int(i * (m / n))
+        for j in range(max(1, center - w), min(m, center + w + 1) + 1):
+            cost[i, j] = abs(x[i - 1] - y[j - 1]) + min(
+                cost[i - 1, j], cost[i, j - 1], cost[i - 1, j - 1]
+            )
+    return cost[n, m]
+
+
+@pytest.mark.parametrize("n,m,band", [(50, 30, 0.1), (30, 50, 0.1), (80, 80, 0.05), (7, 3, 0.5)])
+def test_dtw_rolling_rows_match_full_matrix(n, m, band):
+    """Test the two-row DTW matches a full cost matrix as the band slides."""
+    rng = np.random.default_rng(n * 100 + m)
+    x = rng.normal(0, 10, n)
+    y = rng.normal(0, 10, m)
+
+    assert compute_dtw_lite(x, y, band_width_ratio=band) == pytest.approx(
+        _reference_banded_dtw(x, y, band)
+    )
+
+
+@pytest.mark.parametrize("n,m", [(40, 25), (25, 40), (60, 60)])
+def test_dtw_path_is_an_optimal_warping_path(n, m):
+    """Test the row-vectorised path fill yields a valid minimum-cost path."""
+    rng = np.random.default_rng(n + m)
+    x = rng.integers(0, 50, n).astype(float)
+    y = rng.integers(0, 50, m).astype(float)
+
+    path = compute_dtw_path(x, y, band_width_ratio=1.0)
+
+    assert path[0] == (0, 0)
+    assert path[-1] == (n - 1, m - 1)
+    steps = np.diff(np.array(path), axis=0)
+    assert ((steps >= 0) & (steps <= 1)).all() and (steps.sum(axis=1) > 0).all()
+    path_cost = sum(abs(x[i] - y[j]) for i, j in path)
+    assert path_cost == _reference_banded_dtw(x, y, 1.0)
@@ -28,6 +28,9 @@ class MockProfileStore:
     def get_past_cycles(self):
         return self.past_cycles
 
+    def get_cycle(self, cycle_id):
+        return next((c for c in self.past_cycles if c.get("id") == cycle_id), None)
+
     def get_profiles(self):
         return self.profiles
     
@@ -219,3 +219,30 @@ def test_normal_prediction_low_variance(manager):
         # Expected: Old(50) * 0.8 + New(55) * 0.2 = 51.0
         assert 50.9 < manager._cycle_progress < 51.1
 
+
+
+def test_match_views_are_built_once_per_result(manager):
+    """Test sensor-facing match views are reused until the result changes."""
+    res = MatchResult(
+        best_profile="Cotton 40",
+        confidence=0.85,
+        expected_duration=5400.0,
+        matched_phase=None,
+        candidates=[{"name": "Cotton 40", "score": 0.85, "current": [1.0] * 50}],
+        is_ambiguous=False,
+        ambiguity_margin=0.2,
+    )
+    manager._last_match_result = res
+
+    with patch.object(MatchResult, "to_dict", autospec=True, side_effect=lambda r: {"best": r.best_profile}) as to_dict:
+        assert manager.last_match_details == {"best": "Cotton 40"}
+        assert manager.last_match_details is manager.last_match_details
+        assert to_dict.call_count == 1
+    assert manager.top_candidates is manager.top_candidates
+    assert manager.top_candidates == [
+        {"name": "Cotton 40", "score": 0.85, "profile_duration": None}
+    ]
+
+    manager._last_match_result = None
+    assert manager.last_match_details is None
+    assert manager.top_candidates == []
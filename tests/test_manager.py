@@ -358,6 +358,21 @@ def test_cycle_start_time_exposed(manager: WashDataManager) -> None:
     type(manager.detector).current_cycle_start = PropertyMock(return_value=None)
     assert manager.cycle_start_time is None
 
+def test_cycle_elapsed_seconds_uses_monotonic_anchor(manager: WashDataManager) -> None:
+    """Test elapsed time is anchored once per cycle, then read from the monotonic clock."""
+    start = dt_util.now() - timedelta(seconds=120)
+    type(manager.detector).current_cycle_start = PropertyMock(return_value=start)
+
+    with patch("custom_components.ha_washdata.manager.time.monotonic", return_value=1000.0):
+        assert manager.cycle_elapsed_seconds == 120
+    with patch("custom_components.ha_washdata.manager.time.monotonic", return_value=1030.0), \
+         patch("custom_components.ha_washdata.manager.dt_util.now") as mock_now:
+        assert manager.cycle_elapsed_seconds == 150
+        mock_now.assert_not_called()
+
+    type(manager.detector).current_cycle_start = PropertyMock(return_value=None)
+    assert manager.cycle_elapsed_seconds == 0
+
 @pytest.mark.asyncio
 async def test_restore_active_cycle_paused(manager: WashDataManager) -> None:
     """Test restoring a cycle that was in PAUSED state."""
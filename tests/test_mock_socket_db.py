@@ -0,0 +1,104 @@
+"""Tests for the mock socket's packed power reading storage."""
+import sqlite3
+import time
+
+import numpy as np
+import pytest
+
+from devtools.mqtt_mock_socket import (
+    DBManager,
+    _READING_DTYPE,
+    pack_readings,
+    unpack_readings,
+)
+
+
+@pytest.fixture
+def db(tmp_path):
+    manager = DBManager(str(tmp_path / "mock_socket.db"))
+    yield manager
+    manager.close()
+
+
+def _last_full_hour() -> int:
+    return (int(time.time()) // 3600 - 1) * 3600
+
+
+def test_pack_readings_round_trip_splits_at_hours():
+    """Test samples come back exactly, one chunk per clock hour."""
+    base = 3600 * 1000
+    rows = [(base + 10.7, 120.5), (base + 3599.0, 0.0), (base + 3600.0, 2100.25), (base + 3700.0, -1.5)]
+
+    chunks = pack_readings(rows)
+
+    assert [start_ts for start_ts, _ in chunks] == [base, base + 3600]
+    secs, powers = zip(*(unpack_readings(*chunk) for chunk in chunks))
+    assert np.concatenate(secs).tolist() == [base + 10, base + 3599, base + 3600, base + 3700]
+    assert np.concatenate(powers).tolist() == [120.5, 0.0, 2100.25, -1.5]
+
+
+def test_flushes_append_to_the_hour_row(db):
+    """Test repeated flushes within an hour share one row."""
+    base = _last_full_hour()
+    for i in range(3):
+        for j in range(5):
+            db.log_power_reading(float(i * 10 + j), base + i * 60 + j)
+        db.flush_power_readings(wait=True)
+
+    rows = db._get_conn().execute("SELECT start_ts, samples FROM power_readings_blob").fetchall()
+    assert [start_ts for start_ts, _ in rows] == [base]
+    assert len(rows[0][1]) == 15 * _READING_DTYPE.itemsize
+
+    history = db.get_power_history()
+    assert [p for _, p in history] == [float(i * 10 + j) for i in range(3) for j in range(5)]
+    assert history[-1][0] == base + 124
+
+
+def test_migrates_text_readings(tmp_path):
+    """Test the legacy one-row-per-sample table is folded into hour rows."""
+    path = str(tmp_path / "mock_socket.db")
+    base = _last_full_hour()
+    stamps = [base + 5, base + 3599, base + 3605]
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE power_readings (id INTEGER PRIMARY KEY, timestamp TEXT, power REAL)")
+        conn.executemany(
+            "INSERT INTO power_readings (timestamp, power) VALUES (?, ?)",
+            [(time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts)), 10.0 * i) for i, ts in enumerate(stamps)]
+            + [("not a timestamp", 1.0)],
+        )
+    conn.close()
+
+    manager = DBManager(path)
+    try:
+        conn = manager._get_conn()
+        assert conn.execute("SELECT name FROM sqlite_master WHERE name='power_readings'").fetchone() is None
+        assert conn.execute("SELECT COUNT(*) FROM power_readings_blob").fetchone()[0] == 2
+        history = manager.get_power_history(hours=3)
+    finally:
+        manager.close()
+
+    assert history == [(ts, 10.0 * i) for i, ts in enumerate(stamps) if ts <= time.time()]
+
+
+def test_merges_per_flush_chunks(tmp_path):
+    """Test rows from the old per-flush chunk layout merge into hour rows."""
+    path = str(tmp_path / "mock_socket.db")
+    base = _last_full_hour()
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE power_readings_blob (start_ts INTEGER, samples BLOB)")
+        for offset in (0, 30, 60):
+            chunk = np.zeros(2, dtype=_READING_DTYPE)
+            chunk["dt"] = [0, 5]
+            chunk["p"] = [offset, offset + 1]
+            conn.execute("INSERT INTO power_readings_blob VALUES (?, ?)", (base + offset, chunk.tobytes()))
+    conn.close()
+
+    manager = DBManager(path)
+    try:
+        rows = manager._get_conn().execute("SELECT start_ts FROM power_readings_blob").fetchall()
+        history = manager.get_power_history()
+    finally:
+        manager.close()
+
+    assert rows == [(base,)]
+    assert history == [(base + o + d, float(o + d // 5)) for o in (0, 30, 60) for d in (0, 5)]
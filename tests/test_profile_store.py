@@ -2,9 +2,16 @@
 import pytest
 import asyncio
 import inspect
+
+import numpy as np
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, AsyncMock, patch
-from custom_components.ha_washdata.profile_store import ProfileStore
+from custom_components.ha_washdata.profile_store import (
+    ProfileStore,
+    lttb_indices,
+    make_cycle_id,
+    relative_power_arrays,
+)
 
 
 def dt_str(offset_seconds: int) -> str:
@@ -63,7 +70,8 @@ async def test_add_cycle(store):
     assert len(store._data["past_cycles"]) == 1
     saved = store._data["past_cycles"][0]
     assert saved["duration"] == 3600
-    assert "id" in saved
+    assert saved["id"] == make_cycle_id("2023-01-01T12:00:00+00:00", 3600)
+    assert len(saved["id"]) == 12
     assert saved["profile_name"] is None
 
 
@@ -183,6 +191,45 @@ async def test_match_profile(store):
         assert score_bad < 0.5
 
 
+@pytest.mark.asyncio
+async def test_sync_match_profile_caches_sample_power(store):
+    """Test the sync matcher reuses the decompressed sample until invalidated."""
+    start_dt = datetime(2023, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
+    await store.async_add_cycle({
+        "start_time": start_dt.isoformat(),
+        "duration": 100,
+        "status": "completed",
+        "power_data": [
+            [(start_dt + timedelta(seconds=i)).isoformat(), float(i)]
+            for i in range(101)
+        ],
+    })
+    cycle_id = store._data["past_cycles"][0]["id"]
+    await store.create_profile("RampProfile", cycle_id)
+
+    current_data = [
+        ((start_dt + timedelta(seconds=i)).isoformat(), float(i)) for i in range(101)
+    ]
+    with patch(
+        "custom_components.ha_washdata.profile_store.relative_power_arrays",
+        wraps=relative_power_arrays,
+    ) as mock_decomp:
+        first = store.match_profile(current_data, 100.0)
+        second = store.match_profile(current_data, 100.0)
+        assert mock_decomp.call_count == 1
+
+        await store.update_profile("RampProfile", "RampProfile", avg_duration=100.0)
+        store.match_profile(current_data, 100.0)
+        assert mock_decomp.call_count == 2
+
+    assert first.best_profile == second.best_profile == "RampProfile"
+    assert first.confidence == second.confidence
+
+    assert cycle_id in store._cached_sample_power
+    await store.delete_cycle(cycle_id)
+    assert cycle_id not in store._cached_sample_power
+
+
 @pytest.mark.asyncio
 async def test_delete_cycle_rebuilds_envelope(store):
     """Test deleting a cycle works correctly."""
@@ -291,3 +338,181 @@ async def test_create_profile_already_exists(store):
     await store.create_profile("ProfileX", c2_id)
     assert store.get_profiles()["ProfileX"]["avg_duration"] == 200
     assert store.get_profiles()["ProfileX"]["sample_cycle_id"] == c2_id
+
+
+@pytest.mark.asyncio
+async def test_add_cycle_stores_offsets_for_iso_and_numeric_points(store):
+    """ISO, epoch and malformed points all end up as relative [offset, power]."""
+    start = datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    await store.async_add_cycle({
+        "start_time": dt_str(0), "duration": 120, "status": "completed",
+        "power_data": [[dt_str(0), 10.04], [dt_str(60), 20.0], [dt_str(120), 30.0]],
+    })
+    await store.async_add_cycle({
+        "start_time": dt_str(0), "duration": 121, "status": "completed",
+        "power_data": [
+            [start.timestamp(), 10.04],
+            ["not-a-time", 15.0],
+            [start.timestamp() + 60, 20.0],
+            [start.timestamp() + 120, 30.0],
+        ],
+    })
+
+    iso_cycle, numeric_cycle = store.get_past_cycles()
+    expected = [[0.0, 10.0], [60.0, 20.0], [120.0, 30.0]]
+    assert iso_cycle["power_data"] == expected
+    assert numeric_cycle["power_data"] == expected
+    assert iso_cycle["sampling_interval"] == 60.0
+    assert iso_cycle["max_power"] == 30.0
+
+
+@pytest.mark.asyncio
+async def test_get_cycle_index_tracks_list_changes(store):
+    """get_cycle stays correct across add, delete and in-place id changes."""
+    await store.async_add_cycle({"start_time": dt_str(0), "duration": 100})
+    await store.async_add_cycle({"start_time": dt_str(60), "duration": 100})
+    first, second = store.get_past_cycles()
+
+    assert store.get_cycle(first["id"]) is first
+    assert store.get_cycle("missing") is None
+
+    old_id = first["id"]
+    first["id"] = "renamed"
+    assert store.get_cycle("renamed") is first
+    assert store.get_cycle(old_id) is None
+
+    assert await store.delete_cycle(second["id"])
+    assert store.get_cycle(second["id"]) is None
+    assert store.get_cycle("renamed") is first
+
+
+@pytest.mark.asyncio
+async def test_match_skips_resampling_profiles_outside_duration_ratio(store):
+    """Profiles rejected by the duration ratio never get their sample resampled."""
+    store._min_duration_ratio = 0.5
+    store._max_duration_ratio = 1.5
+    for offset, duration in ((0, 600), (3600, 6000)):
+        await store.async_add_cycle({
+            "start_time": dt_str(offset), "duration": duration, "status": "completed",
+            "power_data": [[dt_str(offset + i * 30), 100.0 + i] for i in range(20)],
+        })
+    short_id, long_id = (c["id"] for c in store.get_past_cycles())
+    store._data["profiles"] = {
+        "Short": {"sample_cycle_id": short_id, "avg_duration": 600},
+        "Long": {"sample_cycle_id": long_id, "avg_duration": 6000},
+    }
+
+    current = [(dt_str(i * 30), 100.0 + i) for i in range(20)]
+    with patch.object(
+        store, "_get_cached_sample_segment", wraps=store._get_cached_sample_segment
+    ) as mock_seg:
+        await store.async_match_profile(current, 600.0)
+
+    assert [c.args[0]["id"] for c in mock_seg.call_args_list] == [short_id]
+
+
+@pytest.mark.asyncio
+async def test_retention_repoints_dropped_profile_sample(store):
+    """A profile whose sample is dropped moves to its newest surviving cycle."""
+    store._max_past_cycles = 3
+    for i in range(4):
+        t_str = dt_str(i * 60)
+        await store.async_add_cycle({
+            "start_time": t_str, "duration": 100, "status": "completed",
+            "profile_name": "Keep" if i != 2 else "Other",
+            "power_data": [[t_str, 10]],
+        })
+        if i == 0:
+            oldest_id = store.get_past_cycles()[0]["id"]
+            store._data["profiles"] = {
+                "Keep": {"sample_cycle_id": oldest_id},
+                "Orphan": {"sample_cycle_id": oldest_id},
+            }
+
+    newest_keep = store.get_past_cycles()[-1]
+    assert store.get_cycle(oldest_id) is None
+    assert store.get_profiles()["Keep"]["sample_cycle_id"] == newest_keep["id"]
+    assert "sample_cycle_id" not in store.get_profiles()["Orphan"]
+
+
+def test_resolve_profile_samples_falls_back_to_first_labeled_cycle(store):
+    """Profiles without a usable sample id use their first completed labeled cycle."""
+    store._data["past_cycles"] = [
+        {"id": "a0", "profile_name": "A", "status": "interrupted", "power_data": [[0, 1]]},
+        {"id": "a1", "profile_name": "A", "status": "completed", "power_data": [[0, 1]]},
+        {"id": "b1", "profile_name": "B", "status": "force_stopped", "power_data": [[0, 1]]},
+        {"id": "a2", "profile_name": "A", "status": "completed", "power_data": [[0, 1]]},
+    ]
+    store._data["profiles"] = {
+        "A": {"sample_cycle_id": "gone"},
+        "B": {},
+        "C": {"sample_cycle_id": "a2"},
+        "D": {},
+    }
+
+    resolved, skipped = store._resolve_profile_samples()
+
+    assert [(name, c["id"]) for name, _, c in resolved] == [
+        ("A", "a1"), ("B", "b1"), ("C", "a2"),
+    ]
+    assert len(skipped) == 1 and skipped[0].startswith("D:")
+
+
+def test_lttb_indices_keeps_endpoints_and_spikes():
+    """LTTB keeps first/last samples and a narrow spike that striding would skip."""
+    x = np.arange(5000, dtype=float)
+    y = np.full(5000, 5.0)
+    y[1234] = 900.0
+
+    keep = lttb_indices(x, y, 100)
+
+    assert len(keep) == 100
+    assert keep[0] == 0 and keep[-1] == 4999
+    assert 1234 in keep
+    assert (np.diff(keep) > 0).all()
+    assert lttb_indices(x[:5], y[:5], 100).tolist() == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_match_input_formats_build_identical_arrays(store):
+    """datetime, ISO-string and offset inputs reach resampling as the same arrays."""
+    base = datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    as_dt = [(base + timedelta(seconds=i * 30), 100.0 + i) for i in range(20)]
+    as_iso = [(t.isoformat(), p) for t, p in as_dt]
+    as_offsets = [(float(i * 30), 100.0 + i) for i in range(20)]
+
+    captured = []
+    with patch(
+        "custom_components.ha_washdata.profile_store.resample_adaptive",
+        side_effect=lambda ts, p, **_: captured.append((ts, p)) or ([], 5.0),
+    ):
+        for data in (as_dt, as_iso, as_offsets):
+            await store.async_match_profile(data, 600.0)
+
+    assert len(captured) == 3
+    for ts, p in captured:
+        assert ts.tolist() == [i * 30.0 for i in range(20)]
+        assert p.tolist() == [100.0 + i for i in range(20)]
+
+
+@pytest.mark.asyncio
+async def test_match_skips_executor_when_all_profiles_pruned(store, mock_hass):
+    """No executor job is scheduled when the duration ratio rejects every profile."""
+    store._min_duration_ratio = 0.5
+    store._max_duration_ratio = 1.5
+    await store.async_add_cycle({
+        "start_time": dt_str(0), "duration": 6000, "status": "completed",
+        "power_data": [[dt_str(i * 30), 100.0 + i] for i in range(20)],
+    })
+    store._data["profiles"] = {
+        "Long": {"sample_cycle_id": store.get_past_cycles()[0]["id"], "avg_duration": 6000},
+    }
+    mock_hass.async_add_executor_job.reset_mock()
+
+    result = await store.async_match_profile(
+        [(dt_str(i * 30), 100.0 + i) for i in range(20)], 600.0
+    )
+
+    assert result.best_profile is None
+    assert result.mismatch_reason == "all_rejected"
+    mock_hass.async_add_executor_job.assert_not_called()
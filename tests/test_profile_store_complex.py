@@ -19,6 +19,9 @@ def store(mock_hass):
         store_instance._store = MockStore.return_value
         store_instance._store.async_load = AsyncMock(return_value=None)
         store_instance._store.async_save = AsyncMock()
+        store_instance._active_store = MagicMock()
+        store_instance._active_store.async_load = AsyncMock(return_value=None)
+        store_instance._active_store.async_save = AsyncMock()
         return store_instance
 
 @pytest.mark.asyncio
@@ -112,4 +115,59 @@ async def test_active_cycle_persistence(store):
     assert store.get_last_active_save() is not None
     
     await store.async_clear_active_cycle()
-    assert store.get_active_cycle() is None
\ No newline at end of file
+    assert store.get_active_cycle() is None
+
+
+@pytest.mark.asyncio
+async def test_active_cycle_snapshots_skip_history_file(store):
+    """Snapshots go to the small active-cycle store, never the history file."""
+    for power in (100, 200):
+        await store.async_save_active_cycle({"state": "RUNNING", "power": power})
+        saved = store._active_store.async_save.call_args.args[0]
+        assert set(saved) == {"active_cycle", "last_active_save"}
+        assert saved["active_cycle"]["power"] == power
+
+    assert store._active_store.async_save.await_count == 2
+    store._store.async_save.assert_not_called()
+
+    await store.async_clear_active_cycle()
+    assert store._active_store.async_save.call_args.args[0]["active_cycle"] is None
+    store._store.async_save.assert_not_called()
+
+    # Full saves leave the active-cycle keys to their own store
+    await store.async_save()
+    saved = store._store.async_save.call_args.args[0]
+    assert "active_cycle" not in saved
+    assert "last_active_save" not in saved
+
+async def test_load_prefers_active_cycle_store(store):
+    """The active-cycle store supersedes keys left in an older history file."""
+    store._store.async_load = AsyncMock(return_value={
+        "profiles": {},
+        "past_cycles": [],
+        "active_cycle": {"state": "RUNNING", "power": 1},
+        "last_active_save": "2024-01-01T00:00:00",
+    })
+    store._active_store.async_load = AsyncMock(return_value={
+        "active_cycle": None,
+        "last_active_save": "2024-01-02T00:00:00",
+    })
+
+    await store.async_load()
+
+    assert store.get_active_cycle() is None
+    assert store._data["last_active_save"] == "2024-01-02T00:00:00"
+
+def test_log_adjustment_keeps_last_50(store):
+    """Test adjustment log is capped in place and skips no-op changes."""
+    adjustments = store._data["auto_adjustments"]
+    store.log_adjustment("min_power", 1.0, 1.0, "no change")
+    assert adjustments == []
+
+    for i in range(55):
+        store.log_adjustment("min_power", i, i + 1, f"step {i}")
+
+    assert store._data["auto_adjustments"] is adjustments
+    assert len(adjustments) == 50
+    assert adjustments[0]["old_value"] == 5
+    assert adjustments[-1]["new_value"] == 55
@@ -1,7 +1,22 @@
+import base64
+import zlib
+
 import pytest
+import numpy as np
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, AsyncMock, patch
-from custom_components.ha_washdata.profile_store import ProfileStore, compress_power_data, decompress_power_data
+from custom_components.ha_washdata.const import STORAGE_VERSION
+from custom_components.ha_washdata.profile_store import (
+    ProfileStore,
+    WashDataStore,
+    _unpack_store_cycles,
+    compress_power_data,
+    decompress_power_data,
+    downsample_indices,
+    pack_power_data,
+    pack_store_cycles,
+    unpack_power_data,
+)
 
 @pytest.fixture
 def store(mock_hass):
@@ -10,6 +25,9 @@ def store(mock_hass):
         store_instance._store = MockStore.return_value
         store_instance._store.async_load = AsyncMock(return_value=None)
         store_instance._store.async_save = AsyncMock()
+        store_instance._active_store = MagicMock()
+        store_instance._active_store.async_load = AsyncMock(return_value=None)
+        store_instance._active_store.async_save = AsyncMock()
         return store_instance
 
 def test_compression_decompression(store):
@@ -77,4 +95,146 @@ def test_envelope_extraction(store):
     assert len(env["avg"]) == 3
     
     # Missing profile
-    assert store.get_envelope("Missing") is None
\ No newline at end of file
+    assert store.get_envelope("Missing") is None
+
+def test_pack_unpack_power_data_roundtrip():
+    """Test packed blobs restore the stored 0.1 grid exactly."""
+    points = [[0.0, 0.0], [10.5, 100.3], [3600.1, 2150.7], [86399.9, 1.2]]
+
+    blob = pack_power_data(points)
+    assert isinstance(blob, str)
+    assert unpack_power_data(blob) == points
+
+    # Legacy ISO-string traces are left for plain JSON
+    assert pack_power_data([["2025-01-01T10:00:00+00:00", 1.0]]) is None
+
+
+def test_pack_power_data_wide_range_and_unknown_format():
+    """Test high/negative power round-trips and unprefixed blobs are rejected."""
+    steady = [[float(i * 30), 2100.4] for i in range(500)]
+    assert unpack_power_data(pack_power_data(steady)) == steady
+
+    # EV chargers exceed the uint16 deciwatt range; sensors may report < 0
+    wide = [[0.0, 11040.5], [5.5, -2.3], [12.0, 0.0]]
+    assert unpack_power_data(pack_power_data(wide)) == wide
+
+    unprefixed = base64.b64encode(
+        zlib.compress(np.asarray(steady, dtype=np.float32).tobytes())
+    ).decode("ascii")
+    with pytest.raises(ValueError):
+        unpack_power_data(unprefixed)
+
+    data = {"past_cycles": [{"id": "c1", "power_data": unprefixed}]}
+    _unpack_store_cycles(data)
+    assert "power_data" not in data["past_cycles"][0]
+
+
+def test_pack_store_cycles_leaves_live_data_untouched():
+    """Test the save payload packs power_data without touching live data."""
+    points = [[0.0, 5.0], [60.0, 500.0]]
+    live = {
+        "profiles": {},
+        "past_cycles": [
+            {"id": "c1", "power_data": points},
+            {"id": "c2"},
+        ],
+    }
+
+    packed = pack_store_cycles(live)
+
+    assert isinstance(packed["past_cycles"][0]["power_data"], str)
+    assert packed["past_cycles"][1] is live["past_cycles"][1]
+    assert live["past_cycles"][0]["power_data"] is points
+
+
+@pytest.mark.asyncio
+async def test_save_packs_in_place_edits_of_power_data(store):
+    """Test a cycle's power_data edited in place is re-packed on the next save."""
+    points = [[0.0, 5.0], [60.0, 500.0]]
+    store._data["past_cycles"] = [{"id": "c1", "power_data": points}]
+
+    await store.async_save()
+    # Packing runs in the executor, never on the event loop
+    assert store.hass.async_add_executor_job.call_args.args[0] is pack_store_cycles
+    first = store._store.async_save.call_args.args[0]["past_cycles"][0]["power_data"]
+    assert unpack_power_data(first) == [[0.0, 5.0], [60.0, 500.0]]
+
+    points.append([120.0, 0.0])
+    points[1][1] = 450.0
+    await store.async_save()
+    second = store._store.async_save.call_args.args[0]["past_cycles"][0]["power_data"]
+    assert unpack_power_data(second) == [[0.0, 5.0], [60.0, 450.0], [120.0, 0.0]]
+
+
+@pytest.mark.asyncio
+async def test_migrate_to_v4_expands_blobs_and_rejects_newer(mock_hass):
+    """Test v3 payloads migrate to expanded lists and newer majors are refused."""
+    wd_store = WashDataStore(mock_hass, STORAGE_VERSION, "ha_washdata.test")
+    points = [[0.0, 5.0], [60.0, 500.0]]
+    old = {
+        "profiles": {},
+        "past_cycles": [
+            {"id": "c1", "status": "completed", "power_data": pack_power_data(points)},
+        ],
+    }
+
+    migrated = await wd_store._async_migrate_func(3, 1, old)
+    assert migrated["past_cycles"][0]["power_data"] == points
+
+    # Finer-than-0.1 legacy values are snapped to the packed grid
+    fine = {"past_cycles": [{"id": "c2", "power_data": [[0.0, 5.04], [10.26, 99.96]]}]}
+    migrated = await wd_store._async_migrate_func(3, 1, fine)
+    assert migrated["past_cycles"][0]["power_data"] == [[0.0, 5.0], [10.3, 100.0]]
+
+    with pytest.raises(NotImplementedError):
+        await wd_store._async_migrate_func(STORAGE_VERSION + 1, 1, {})
+
+
+def test_compression_downsamples_steady_power():
+    """Steady readings collapse to endpoints, changes and 60s keep-alives."""
+    base = datetime(2025, 1, 1, 10, 0, 0, tzinfo=timezone.utc).timestamp()
+    powers = [100.0] * 10 + [100.5] + [200.0] * 2
+    raw_data = [
+        [datetime.fromtimestamp(base + 10 * i, timezone.utc).isoformat(), p]
+        for i, p in enumerate(powers)
+    ]
+    cycle = {"start_time": raw_data[0][0], "power_data": raw_data}
+
+    assert compress_power_data(cycle) == [
+        [0.0, 100.0],
+        [70.0, 100.0],
+        [110.0, 200.0],
+        [120.0, 200.0],
+    ]
+
+
+def test_downsample_keeps_slow_drift_against_last_kept_sample():
+    """A ramp below 1 W per step still keeps a point every 1 W of drift."""
+    offsets = np.arange(0.0, 50.0, 5.0)
+    powers = np.arange(10, dtype=float) * 0.4  # 0.0 .. 3.6 W, 0.4 W per step
+
+    keep = downsample_indices(offsets, powers)
+
+    assert keep.tolist() == [0, 3, 6, 9]
+
+
+@pytest.mark.asyncio
+async def test_load_warms_sample_power_cache(store):
+    """Loading builds float32 power arrays for profile sample cycles only."""
+    store._store.async_load = AsyncMock(return_value={
+        "past_cycles": [
+            {"id": "s1", "start_time": "2025-01-01T10:00:00+00:00",
+             "power_data": [[0.0, 10.0], [10.0, 250.5]]},
+            {"id": "u1", "start_time": "2025-01-01T12:00:00+00:00",
+             "power_data": [[0.0, 5.0], [10.0, 5.0]]},
+        ],
+        "profiles": {"Cotton": {"sample_cycle_id": "s1"}},
+        "envelopes": {},
+    })
+
+    await store.async_load()
+
+    assert set(store._cached_sample_power) == {"s1"}
+    cached = store._cached_sample_power["s1"]
+    assert cached.dtype == np.float32
+    assert cached.tolist() == [10.0, 250.5]
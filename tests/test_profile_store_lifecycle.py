@@ -21,6 +21,9 @@ def store(mock_hass):
         store_instance._store = MockStore.return_value
         store_instance._store.async_load = AsyncMock(return_value=None)
         store_instance._store.async_save = AsyncMock()
+        store_instance._active_store = MagicMock()
+        store_instance._active_store.async_load = AsyncMock(return_value=None)
+        store_instance._active_store.async_save = AsyncMock()
         return store_instance
 
 @pytest.mark.asyncio
@@ -188,3 +191,61 @@ async def test_match_result_serialization():
     assert d["confidence"] == 0.95
     # Should exclude heavy arrays
     assert "current" not in d["candidates"][0]
+
+@pytest.mark.asyncio
+async def test_interactive_merge_assigns_new_id(store):
+    """Test merging two cycles produces a fresh 12-char id and repoints samples."""
+    start_base = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    for i in range(2):
+        seg_start = start_base + timedelta(minutes=20 * i)
+        await store.async_add_cycle({
+            "start_time": seg_start.isoformat(),
+            "duration": 600.0,
+            "max_power": 100.0 + i,
+            "status": "completed",
+            "power_data": [
+                [(seg_start + timedelta(seconds=s)).isoformat(), 100.0]
+                for s in range(0, 601, 60)
+            ],
+        })
+    ids = [c["id"] for c in store.get_past_cycles()]
+    store._data["profiles"]["P"] = {"sample_cycle_id": ids[1]}
+
+    new_id = await store.apply_merge_interactive(ids, "P")
+
+    assert new_id is not None
+    assert len(new_id) == 12
+    assert new_id not in ids
+    assert [c["id"] for c in store.get_past_cycles()] == [new_id]
+    assert store.get_profiles()["P"]["sample_cycle_id"] == new_id
+    assert store.get_past_cycles()[0]["max_power"] == 101.0
+
+
+@pytest.mark.asyncio
+async def test_interactive_merge_gap_fills_trace(store):
+    """Test merged trace keeps both parts on c1's time base with 0W gap markers."""
+    start_base = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    for i in range(2):
+        seg_start = start_base + timedelta(minutes=20 * i)
+        await store.async_add_cycle({
+            "start_time": seg_start.isoformat(),
+            "duration": 600.0,
+            "status": "completed",
+            "power_data": [
+                [(seg_start + timedelta(seconds=s)).isoformat(), 100.0 + i]
+                for s in range(0, 601, 60)
+            ],
+        })
+    ids = [c["id"] for c in store.get_past_cycles()]
+
+    await store.apply_merge_interactive(ids, None)
+
+    merged = store.get_past_cycles()[0]
+    trace = merged["power_data"]
+    assert merged["duration"] == 1800.0
+    assert len(trace) == 24
+    assert trace[10] == [600.0, 100.0]
+    assert trace[11:13] == [[600.1, 0.0], [1199.9, 0.0]]
+    assert trace[13] == [1200.0, 101.0]
+    assert trace[-1] == [1800.0, 101.0]
+    assert merged["max_power"] == 101.0
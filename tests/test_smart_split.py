@@ -120,3 +120,74 @@ async def test_async_split_cycles_smart(store):
         
         # Verify Envelope Rebuild was triggered
         store.async_rebuild_envelope.assert_called_with("TestProfile")
+
+
+@pytest.mark.asyncio
+async def test_apply_split_interactive_segments(store):
+    """Test manual split carries the pre-segment state and in-range points."""
+    start_time = datetime(2023, 1, 1, 12, 0, 0)
+    power_data = [[float(t), 100.0] for t in range(0, 601, 60)]
+    power_data += [[1200.0, 5.0], [2000.0, 5.0]]
+    power_data += [[float(t), 200.0] for t in range(2400, 3001, 60)]
+    store._data["past_cycles"].append({
+        "id": "original_cycle",
+        "start_time": start_time.isoformat(),
+        "duration": 3000.0,
+        "status": "completed",
+        "power_data": power_data,
+        "profile_name": None,
+    })
+
+    new_ids = await store.apply_split_interactive(
+        "original_cycle",
+        [{"start": 0.0, "end": 600.0, "profile": None},
+         {"start": 2100.0, "end": 3000.0, "profile": None}],
+    )
+
+    assert len(new_ids) == 2
+    first, second = store._data["past_cycles"]
+    assert first["duration"] == 600.0
+    assert first["power_data"][0] == [0.0, 100.0]
+    assert first["power_data"][-1] == [600.0, 100.0]
+    assert len(first["power_data"]) == 11
+
+    # Second segment starts in the idle gap: state is the last idle reading
+    assert second["start_time"] == (start_time + timedelta(seconds=2100)).isoformat()
+    assert second["power_data"][0] == [0.0, 5.0]
+    assert second["power_data"][1] == [300.0, 200.0]
+    assert second["power_data"][-1] == [900.0, 200.0]
+
+
+def _split_oracle(points, min_gap_s, idle_power):
+    """Reference sequential gap scan (pre-vectorisation semantics)."""
+    segments = []
+    seg_start = 0.0
+    for i in range(1, len(points)):
+        t, _ = points[i]
+        prev_t, prev_p = points[i - 1]
+        if prev_p < idle_power and t - prev_t > min_gap_s:
+            if prev_t - seg_start > 60:
+                segments.append((seg_start, prev_t))
+            seg_start = t
+    if points[-1][0] - seg_start > 60:
+        segments.append((seg_start, points[-1][0]))
+    return segments if len(segments) >= 2 else []
+
+
+@pytest.mark.parametrize("min_gap_s", [300, 900])
+def test_analyze_split_sync_matches_sequential_scan(store, min_gap_s):
+    """Vectorised gap detection finds the same segments as the sequential scan."""
+    points = [[float(t), 150.0] for t in range(0, 601, 60)]
+    points += [[1000.0, 1.0], [1500.0, 1.0]]           # idle gap, then short burst
+    points += [[1530.0, 80.0], [2500.0, 0.5]]           # long gap after non-idle
+    points += [[float(t), 200.0] for t in range(3600, 4201, 60)]
+    cycle = {
+        "id": "c",
+        "start_time": datetime(2023, 1, 1, 12, 0, 0).isoformat(),
+        "power_data": points,
+    }
+
+    result = store.analyze_split_sync(cycle, min_gap_s=min_gap_s, idle_power=2.0)
+
+    assert result == _split_oracle(points, min_gap_s, 2.0)
+    assert result